@@ -10,9 +10,13 @@ Core Principles:
 - Research integrity over convenience
 """
 
-from aquila_r.core.agent import AquilaR
-from aquila_r.core.identity import AgentIdentity, AgentRole
-from aquila_r.core.config import AquilaConfig
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from aquila_r.core.agent import AquilaR
+    from aquila_r.core.identity import AgentIdentity, AgentRole
+    from aquila_r.core.config import AquilaConfig
 
 __version__ = "1.0.0"
 __author__ = "Aquila-R Team"
@@ -23,3 +27,27 @@ __all__ = [
     "AgentRole",
     "AquilaConfig",
 ]
+
+# Public names resolved on first access, so importing a subpackage such
+# as aquila_r.output does not pull in the agent and its HTTP client
+_LAZY_IMPORTS = {
+    "AquilaR": "aquila_r.core.agent",
+    "AgentIdentity": "aquila_r.core.identity",
+    "AgentRole": "aquila_r.core.identity",
+    "AquilaConfig": "aquila_r.core.config",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including names not yet imported."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -0,0 +1,52 @@
+"""
+Multi-term substring scanning shared by Aquila-R checkers.
+
+Validators and evaluators flag text containing any of a list of
+terms. Scanning once with a single compiled pattern replaces one
+substring check per term while reporting the same terms.
+"""
+
+import functools
+import re
+from typing import List, Sequence, Set, Tuple
+
+
+@functools.lru_cache(maxsize=32)
+def term_scanner(terms: Tuple[str, ...]) -> Tuple["re.Pattern[str]", Tuple[str, ...]]:
+    """
+    Compile terms into one overlapping-match scanner.
+    
+    The alternation sits in a lookahead, longest term first, so every
+    start position reports its longest term in a single pass. Terms that
+    are a prefix of another term can be shadowed at the same position
+    and are returned separately for a direct substring check.
+    """
+    ordered = sorted(terms, key=len, reverse=True)
+    pattern = re.compile(
+        "(?=(" + "|".join(re.escape(term) for term in ordered) + "))"
+    )
+    shadowed = tuple(
+        term for term in terms
+        if any(other != term and other.startswith(term) for other in terms)
+    )
+    return pattern, shadowed
+
+
+def found_terms(terms: Sequence[str], text: str) -> Set[str]:
+    """Return the terms occurring as substrings of text, in one scan."""
+    pattern, shadowed = term_scanner(tuple(terms))
+    found = {match.group(1) for match in pattern.finditer(text)}
+    found.update(term for term in shadowed if term in text)
+    return found
+
+
+def terms_in(terms: Sequence[str], text: str) -> List[str]:
+    """Return the terms occurring in text, in term-list order."""
+    found = found_terms(terms, text)
+    return [term for term in terms if term in found]
+
+
+def contains_any(terms: Sequence[str], text: str) -> bool:
+    """Check whether any term occurs in text, stopping at the first."""
+    # A prefix term is only shadowed where a longer term matches instead
+    return term_scanner(tuple(terms))[0].search(text) is not None
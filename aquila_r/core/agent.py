@@ -248,6 +248,42 @@ class AquilaR:
         """
         Perform research analysis on a query.
         
+        Args:
+            query: The research question or topic
+            modules: Which modules to use (literature, synthesis, critical, etc.)
+            methodology: Methodological paradigm to apply
+            output_language: Desired output language
+            max_sources: Maximum sources to consult
+            context: Additional context for the analysis
+            
+        Returns:
+            Structured research output
+        """
+        # Run async execution synchronously
+        return int_asyncio.run(self.aanalyze(
+            query=query,
+            modules=modules,
+            methodology=methodology,
+            output_language=output_language,
+            max_sources=max_sources,
+            context=context,
+        ))
+    
+    async def aanalyze(
+        self,
+        query: str,
+        modules: Optional[List[str]] = None,
+        methodology: Optional[MethodologyParadigm] = None,
+        output_language: Optional[OutputLanguage] = None,
+        max_sources: int = 20,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> ResearchOutput:
+        """
+        Perform research analysis on a query from a running event loop.
+        
+        Same as analyze, but awaitable, so several analyses can run
+        concurrently (e.g. with asyncio.gather).
+        
         Args:
             query: The research question or topic
             modules: Which modules to use (literature, synthesis, critical, etc.)
@@ -268,8 +304,7 @@ class AquilaR:
             context=context,
         )
         
-        # Run async execution synchronously
-        return int_asyncio.run(self._execute_research(request))
+        return await self._execute_research(request)
     
     async def _execute_research(self, request: ResearchRequest) -> ResearchOutput:
         """Execute a research request."""
@@ -478,12 +513,19 @@ class AquilaR:
     
     def get_status(self) -> Dict[str, Any]:
         """Get agent status information."""
+        # Run async status check synchronously
+        return int_asyncio.run(self.aget_status())
+    
+    async def aget_status(self) -> Dict[str, Any]:
+        """
+        Get agent status information from a running event loop.
         
+        Same as get_status, but awaits the LLM connection check instead
+        of starting a new event loop for it.
+        """
         # Check LLM connection
-        llm_connected = False
         try:
-            # We need to run the async check synchronously here
-            llm_connected = int_asyncio.run(self.llm.check_connection())
+            llm_connected = await self.llm.check_connection()
         except Exception:
             llm_connected = False
             
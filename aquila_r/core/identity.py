@@ -11,10 +11,12 @@ Key Principles:
 """
 
 from enum import Enum
-from typing import List, Optional, Set
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional, Set, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 
+from aquila_r._terms import found_terms
+
 
 class AgentRole(str, Enum):
     """
@@ -166,6 +168,22 @@ class LanguageEquality(BaseModel):
     )
 
 
+# Phrases flagged by AgentIdentity.validate_response, in report order
+_FABRICATION_INDICATORS = (
+    "(forthcoming)",
+    "(in press)",
+    "et al., 20",  # Vague citations
+)
+_OVERSTATEMENT_PHRASES = (
+    "clearly proves",
+    "definitively shows",
+    "without doubt",
+    "certainly demonstrates",
+    "undeniably",
+)
+_RESPONSE_FLAGS = _FABRICATION_INDICATORS + _OVERSTATEMENT_PHRASES
+
+
 class AgentIdentity(BaseModel):
     """
     Complete identity specification for Aquila-R.
@@ -230,6 +248,12 @@ class AgentIdentity(BaseModel):
         description="Identity creation timestamp"
     )
     
+    # Rendered prompts keyed by (arabic, name, full_name, primary_directive),
+    # the only fields the prompts read, so reassigning them misses the cache
+    _prompt_cache: Dict[Tuple[bool, str, str, str], str] = PrivateAttr(
+        default_factory=dict
+    )
+    
     def get_system_prompt(self, language: str = "en") -> str:
         """
         Generate the system prompt that defines agent behavior.
@@ -240,9 +264,15 @@ class AgentIdentity(BaseModel):
         Returns:
             Complete system prompt for LLM configuration
         """
-        if language == "ar":
-            return self._get_arabic_system_prompt()
-        return self._get_english_system_prompt()
+        arabic = language == "ar"
+        key = (arabic, self.name, self.full_name, self.primary_directive)
+        prompt = self._prompt_cache.get(key)
+        if prompt is None:
+            prompt = self._prompt_cache[key] = (
+                self._get_arabic_system_prompt() if arabic
+                else self._get_english_system_prompt()
+            )
+        return prompt
     
     def _get_english_system_prompt(self) -> str:
         """Generate English system prompt."""
@@ -389,33 +419,23 @@ When responding, state assumptions, clarify methodology, separate evidence from
         Returns:
             List of validation warnings (empty if valid)
         """
-        warnings = []
+        warnings: List[str] = []
+        # Every flagged phrase in one pass
+        found = found_terms(_RESPONSE_FLAGS, response.lower())
+        if not found:
+            return warnings
         
         # Check for potential citation fabrication indicators
-        fabrication_indicators = [
-            "(forthcoming)",
-            "(in press)",
-            "et al., 20",  # Vague citations
-        ]
-        
-        for indicator in fabrication_indicators:
-            if indicator in response.lower():
+        for indicator in _FABRICATION_INDICATORS:
+            if indicator in found:
                 warnings.append(
                     f"Potential fabrication risk: '{indicator}' found. "
                     "Verify all citations are from retrieved sources."
                 )
         
         # Check for overstatement language
-        overstatement_phrases = [
-            "clearly proves",
-            "definitively shows",
-            "without doubt",
-            "certainly demonstrates",
-            "undeniably",
-        ]
-        
-        for phrase in overstatement_phrases:
-            if phrase in response.lower():
+        for phrase in _OVERSTATEMENT_PHRASES:
+            if phrase in found:
                 warnings.append(
                     f"Potential overstatement: '{phrase}' found. "
                     "Consider hedging language unless evidence is conclusive."
@@ -8,10 +8,13 @@ research understanding across interactions.
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
+from pydantic_core import to_json
 from enum import Enum
 import json
 import hashlib
 
+from aquila_r.core.memory_sqlite import SQLiteMemoryIndex
+
 
 class MemoryItemType(str, Enum):
     """Types of items stored in memory."""
@@ -166,15 +169,39 @@ class ResearchMemory:
         self.session_items: List[MemoryItem] = []
         self.projects: Dict[str, ProjectContext] = {}
         self.active_project_id: Optional[str] = None
+        
+        # Full-text index mirroring session_items; also serves type counts
+        self._index = SQLiteMemoryIndex()
     
     def add_item(self, item: MemoryItem) -> None:
         """Add an item to session memory."""
         self.session_items.append(item)
+        self._index.add(item)
+        self._prune()
+    
+    def add_items(self, items: List[MemoryItem]) -> None:
+        """
+        Add several items to session memory at once.
         
-        # Prune if exceeds limit
+        Equivalent to calling add_item for each item, but indexes them
+        in one batched insert and prunes once at the end. Like add_item,
+        this only touches session memory; use record_findings to also
+        attach findings to the active project.
+        
+        Args:
+            items: Items to add, in order
+        """
+        self.session_items.extend(items)
+        self._index.add_many(items)
+        self._prune()
+    
+    def _prune(self) -> None:
+        """Drop the lowest-relevance items beyond max_items."""
         if len(self.session_items) > self.max_items:
             # Remove lowest relevance items
             self.session_items.sort(key=lambda x: x.relevance_score, reverse=True)
+            dropped = self.session_items[self.max_items:]
+            self._index.remove(dropped)
             self.session_items = self.session_items[:self.max_items]
     
     def add_source(
@@ -247,6 +274,53 @@ class ResearchMemory:
         
         return finding
     
+    def record_findings(
+        self,
+        contents: List[str],
+        language: str = "en",
+        source_id: Optional[str] = None,
+        confidence: float = 0.8,
+    ) -> List[MemoryItem]:
+        """
+        Record several research findings sharing language, source and confidence.
+        
+        Equivalent to calling record_finding for each text: every finding
+        is also added to the active project, including findings pruned
+        from session memory.
+        
+        Args:
+            contents: Finding texts, in order
+            language: Language of the findings
+            source_id: Source the findings come from
+            confidence: Confidence applied to every finding
+            
+        Returns:
+            The recorded memory items
+        """
+        findings = []
+        for content in contents:
+            finding = MemoryItem.create(
+                type=MemoryItemType.FINDING,
+                content=content,
+                language=language,
+                metadata={
+                    "source_id": source_id,
+                    "confidence": confidence,
+                },
+            )
+            finding.relevance_score = confidence
+            findings.append(finding)
+        
+        self.add_items(findings)
+        
+        if self.active_project_id and self.enable_project_memory:
+            project = self.projects.get(self.active_project_id)
+            if project:
+                for finding in findings:
+                    project.add_finding(finding)
+        
+        return findings
+    
     def record_assumption(self, assumption: str) -> MemoryItem:
         """Record a methodological assumption."""
         item = MemoryItem.create(
@@ -323,34 +397,81 @@ class ResearchMemory:
         
         return candidates[:max_items]
     
+    def search(
+        self,
+        query: str,
+        max_items: int = 10,
+        item_types: Optional[List[MemoryItemType]] = None,
+    ) -> List[MemoryItem]:
+        """
+        Full-text search over session memory content.
+        
+        Args:
+            query: Free-text query; items matching any term are returned
+            max_items: Maximum items to return
+            item_types: Filter by specific item types
+            
+        Returns:
+            Matching memory items, best match first
+        """
+        return self._synced_index().search(query, max_items, item_types)
+    
+    def _synced_index(self) -> SQLiteMemoryIndex:
+        """Return the full-text index, rebuilt if session_items was changed directly."""
+        if not self._index.matches(self.session_items):
+            self._index.rebuild(self.session_items)
+        return self._index
+    
+    def _counted_index(self) -> SQLiteMemoryIndex:
+        """
+        Return the index for type counts, rebuilt if items were added or removed directly.
+        
+        Only the lengths are compared, keeping summaries O(1); an item
+        edited or replaced in place is picked up by the next search.
+        """
+        if len(self._index) != len(self.session_items):
+            self._index.rebuild(self.session_items)
+        return self._index
+    
     def get_session_summary(self) -> Dict[str, Any]:
         """Get summary of current session memory."""
-        type_counts: Dict[str, int] = {}
-        for item in self.session_items:
-            type_counts[item.type.value] = type_counts.get(item.type.value, 0) + 1
-        
         return {
             "total_items": len(self.session_items),
-            "items_by_type": type_counts,
+            "items_by_type": self._counted_index().count_by_type(),
             "active_project": self.active_project_id,
             "projects_count": len(self.projects),
         }
     
+    def close(self) -> None:
+        """
+        Release the search index's SQLite connection.
+        
+        Memory stays usable; search then scans session items instead.
+        """
+        self._index.close()
+    
     def clear_session(self) -> None:
         """Clear session memory (preserves project memory)."""
         self.session_items = []
+        self._index.clear()
     
     def export_to_json(self) -> str:
-        """Export memory state to JSON."""
+        """
+        Export memory state to JSON.
+        
+        Models are serialized directly by pydantic-core, without an
+        intermediate dict per item. The output parses to the same data
+        as json.dumps(indent=2) over model_dump(mode="json"), but the text
+        differs: floats use their shortest form (0.00001, not 1e-05), and
+        metadata values JSON cannot represent are written with str()
+        instead of raising.
+        """
         data = {
-            "session_items": [i.model_dump(mode="json") for i in self.session_items],
-            "projects": {
-                pid: p.model_dump(mode="json")
-                for pid, p in self.projects.items()
-            },
+            "session_items": self.session_items,
+            "projects": self.projects,
             "active_project_id": self.active_project_id,
         }
-        return json.dumps(data, default=str, ensure_ascii=False, indent=2)
+        return to_json(data, indent=2, fallback=str).decode()
     
     @classmethod
     def from_json(cls, json_str: str, max_items: int = 100) -> "ResearchMemory":
@@ -361,6 +482,7 @@ class ResearchMemory:
         
         for item_data in data.get("session_items", []):
             memory.session_items.append(MemoryItem(**item_data))
+        memory._index.rebuild(memory.session_items)
         
         for pid, project_data in data.get("projects", {}).items():
             memory.projects[pid] = ProjectContext(**project_data)
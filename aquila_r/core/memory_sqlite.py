@@ -0,0 +1,260 @@
+"""
+SQLite full-text index for Aquila-R research memory.
+
+Mirrors session memory items into an in-memory SQLite FTS5 table so
+content search runs as an index query instead of a scan over every
+item, and keeps running per-type counts for session summaries. The item list on ResearchMemory remains the source of
+truth for export and import; this index is derived from it.
+
+Python builds without FTS5 get the same interface backed by a scan
+over the indexed items.
+"""
+
+import re
+import sqlite3
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from aquila_r.core.memory import MemoryItem, MemoryItemType
+
+
+# Runs of letters and digits; underscores separate tokens, as in unicode61
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def _tokens(text: str) -> List[str]:
+    """Split text into case-folded word tokens, approximating FTS5's unicode61."""
+    return _TOKEN_RE.findall(text.casefold())
+
+
+class SQLiteMemoryIndex:
+    """
+    FTS5 index over memory item content.
+    
+    Rows are keyed by the identity of the indexed item, so an item can
+    be removed without a content lookup and search results map straight
+    back to the stored MemoryItem objects. The index holds a reference
+    to every indexed item, so a key cannot be reused while its row
+    exists.
+    
+    The connection may be used from any thread; a lock serializes
+    access to it. Call close() to release it early; otherwise it is
+    closed when the index is garbage collected.
+    """
+    
+    _SCHEMA = (
+        "CREATE VIRTUAL TABLE items USING fts5("
+        "content, type UNINDEXED, language UNINDEXED)"
+    )
+    
+    def __init__(self) -> None:
+        """Initialize an empty in-memory index."""
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        if self._conn is not None:
+            self._finalizer = weakref.finalize(self, self._conn.close)
+        self._items: Dict[int, MemoryItem] = {}
+        # Indexed column values per row, to detect items edited in place
+        self._rows: Dict[int, Tuple[str, str, str]] = {}
+        # Running item count per type, kept in step with _rows
+        self._type_counts: Dict[str, int] = {}
+    
+    @classmethod
+    def _connect(cls) -> Optional[sqlite3.Connection]:
+        """Open the index database, or None if SQLite lacks FTS5."""
+        conn = sqlite3.connect(":memory:", check_same_thread=False)
+        try:
+            conn.execute(cls._SCHEMA)
+        except sqlite3.OperationalError:
+            conn.close()
+            return None
+        return conn
+    
+    def __len__(self) -> int:
+        """Number of indexed items."""
+        return len(self._items)
+    
+    def close(self) -> None:
+        """
+        Close the SQLite connection.
+        
+        The index keeps working afterwards, answering searches by
+        scanning its items as it does without FTS5.
+        """
+        with self._lock:
+            if self._conn is not None:
+                self._finalizer()
+                self._conn = None
+    
+    @staticmethod
+    def _row(item: "MemoryItem") -> Tuple[str, str, str]:
+        """Column values stored for an item."""
+        return (item.content, item.type.value, item.language)
+    
+    def _set_row(self, key: int, row: Tuple[str, str, str]) -> None:
+        """Record a row's values, moving its type count if it was replaced."""
+        old = self._rows.get(key)
+        if old is not None:
+            self._uncount(old[1])
+        self._rows[key] = row
+        self._type_counts[row[1]] = self._type_counts.get(row[1], 0) + 1
+    
+    def _uncount(self, type_value: str) -> None:
+        """Decrement a type count, dropping the type when none are left."""
+        remaining = self._type_counts[type_value] - 1
+        if remaining:
+            self._type_counts[type_value] = remaining
+        else:
+            del self._type_counts[type_value]
+    
+    def matches(self, items: Sequence["MemoryItem"]) -> bool:
+        """
+        Check whether the index holds exactly these items, unchanged.
+        
+        Args:
+            items: Items the index should mirror
+            
+        Returns:
+            False if any item was added, replaced, removed or edited
+            since it was indexed
+        """
+        with self._lock:
+            if len(items) != len(self._items):
+                return False
+            rows = self._rows
+            row = self._row
+            return all(rows.get(id(item)) == row(item) for item in items)
+    
+    def add(self, item: "MemoryItem") -> None:
+        """Index an item, replacing any earlier row for the same object."""
+        key = id(item)
+        row = self._row(item)
+        with self._lock:
+            if self._conn is not None:
+                if key in self._items:
+                    self._conn.execute("DELETE FROM items WHERE rowid = ?", (key,))
+                self._conn.execute(
+                    "INSERT INTO items (rowid, content, type, language) VALUES (?, ?, ?, ?)",
+                    (key, *row),
+                )
+            self._items[key] = item
+            self._set_row(key, row)
+    
+    def add_many(self, items: Iterable["MemoryItem"]) -> None:
+        """Index several items with one batched insert in a single transaction."""
+        batch = {id(item): item for item in items}
+        rows = {key: self._row(item) for key, item in batch.items()}
+        with self._lock:
+            if self._conn is not None:
+                replaced = [(key,) for key in batch if key in self._items]
+                with self._conn:
+                    if replaced:
+                        self._conn.executemany(
+                            "DELETE FROM items WHERE rowid = ?", replaced
+                        )
+                    self._conn.executemany(
+                        "INSERT INTO items (rowid, content, type, language) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(key, *row) for key, row in rows.items()],
+                    )
+            self._items.update(batch)
+            for key, row in rows.items():
+                self._set_row(key, row)
+    
+    def remove(self, items: Iterable["MemoryItem"]) -> None:
+        """Drop items from the index."""
+        keys = [(id(item),) for item in items]
+        with self._lock:
+            if self._conn is not None:
+                self._conn.executemany("DELETE FROM items WHERE rowid = ?", keys)
+            for (key,) in keys:
+                self._items.pop(key, None)
+                row = self._rows.pop(key, None)
+                if row is not None:
+                    self._uncount(row[1])
+    
+    def rebuild(self, items: Sequence["MemoryItem"]) -> None:
+        """Replace the index contents with the given items."""
+        with self._lock:
+            self.clear()
+            self.add_many(items)
+    
+    def clear(self) -> None:
+        """Remove every row from the index."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM items")
+            self._items.clear()
+            self._rows.clear()
+            self._type_counts.clear()
+    
+    def count_by_type(self) -> Dict[str, int]:
+        """
+        Count indexed items per item type.
+        
+        Counts are kept up to date as items are indexed and removed, so
+        this does not scan. Types appear in the order they were first
+        indexed since their count was last zero.
+        """
+        with self._lock:
+            return dict(self._type_counts)
+    
+    def search(
+        self,
+        query: str,
+        max_items: int = 10,
+        item_types: Optional[List["MemoryItemType"]] = None,
+    ) -> List["MemoryItem"]:
+        """
+        Find items whose content matches any query term, best match first.
+        
+        Args:
+            query: Free-text query; terms are matched literally
+            max_items: Maximum items to return
+            item_types: Filter by specific item types
+            
+        Returns:
+            Matching memory items ranked by BM25, or by matched term
+            count when FTS5 is unavailable
+        """
+        terms = query.split()
+        if not terms:
+            return []
+        
+        # Quote each term so user text never parses as FTS5 syntax
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        sql = "SELECT rowid FROM items WHERE items MATCH ?"
+        params: List[Any] = [match]
+        if item_types:
+            sql += f" AND type IN ({', '.join('?' * len(item_types))})"
+            params.extend(t.value for t in item_types)
+        sql += " ORDER BY rank LIMIT ?"
+        params.append(max_items)
+        
+        with self._lock:
+            if self._conn is None:
+                return self._scan(terms, max_items, item_types)
+            keys = self._conn.execute(sql, params).fetchall()
+            return [self._items[key] for (key,) in keys]
+    
+    def _scan(
+        self,
+        terms: List[str],
+        max_items: int,
+        item_types: Optional[List["MemoryItemType"]],
+    ) -> List["MemoryItem"]:
+        """Search without FTS5, matching each term's words as whole tokens."""
+        term_tokens = [set(_tokens(term)) for term in terms]
+        scored = []
+        for item in self._items.values():
+            if item_types and item.type not in item_types:
+                continue
+            tokens = set(_tokens(item.content))
+            hits = sum(1 for words in term_tokens if words and words <= tokens)
+            if hits:
+                scored.append((hits, item))
+        # Stable sort keeps index order among items with equal hits
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return [item for _, item in scored[:max_items]]
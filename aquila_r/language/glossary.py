@@ -5,13 +5,18 @@ Manages bilingual technical terms across academic domains,
 ensuring consistency in translation and usage.
 """
 
-from typing import Dict, List, Optional, Any, Set
-from pydantic import BaseModel, Field
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Any, Set, Tuple, TypeVar, cast
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
 from datetime import datetime
 from enum import Enum
 import json
 
 
+T = TypeVar('T')
+
+
 class TermStatus(str, Enum):
     """Status of a glossary term."""
     APPROVED = "approved"
@@ -21,7 +26,15 @@ class TermStatus(str, Enum):
 
 
 class GlossaryEntry(BaseModel):
-    """An entry in the technical glossary."""
+    """
+    An entry in the technical glossary.
+    
+    Frozen, with tuple alternatives: the glossary memoizes lookups and
+    indexes terms, so entries must not change once added. To revise an
+    entry, add a model_copy with the updated fields.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     term_en: str = Field(description="English term")
     term_ar: str = Field(description="Arabic term")
@@ -29,8 +42,8 @@ class GlossaryEntry(BaseModel):
     definition_ar: Optional[str] = Field(default=None)
     domain: str = Field(default="general")
     status: TermStatus = Field(default=TermStatus.PROVISIONAL)
-    alternatives_en: List[str] = Field(default_factory=list)
-    alternatives_ar: List[str] = Field(default_factory=list)
+    alternatives_en: Tuple[str, ...] = Field(default_factory=tuple)
+    alternatives_ar: Tuple[str, ...] = Field(default_factory=tuple)
     usage_notes: Optional[str] = Field(default=None)
     source: Optional[str] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -55,6 +68,65 @@ class GlossaryEntry(BaseModel):
         return False
 
 
+def _trigrams(text: str) -> Set[str]:
+    """All three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+@dataclass(slots=True)
+class _SearchIndex:
+    """Trigram postings over glossary terms, as positions into entries."""
+    
+    entries: List[GlossaryEntry]
+    en: Dict[str, Set[int]] = field(default_factory=dict)  # lower-cased term_en
+    ar: Dict[str, Set[int]] = field(default_factory=dict)  # term_ar
+    alt_en: Dict[str, Set[int]] = field(default_factory=dict)  # lower-cased, exact
+    alt_ar: Dict[str, Set[int]] = field(default_factory=dict)  # exact
+    
+    @classmethod
+    def build(cls, entries: Iterable[GlossaryEntry]) -> "_SearchIndex":
+        """Index term trigrams and exact alternatives of the entries."""
+        index = cls(list(entries))
+        for position, entry in enumerate(index.entries):
+            for gram in _trigrams(entry.term_en.lower()):
+                index.en.setdefault(gram, set()).add(position)
+            for gram in _trigrams(entry.term_ar):
+                index.ar.setdefault(gram, set()).add(position)
+            for alternative in entry.alternatives_en:
+                index.alt_en.setdefault(alternative.lower(), set()).add(position)
+            for alternative in entry.alternatives_ar:
+                index.alt_ar.setdefault(alternative, set()).add(position)
+        return index
+    
+    def candidates(self, query: str, query_lower: str) -> List[GlossaryEntry]:
+        """
+        Entries that may match, in glossary order.
+        
+        Superset of the entries whose English term contains query_lower,
+        whose Arabic term contains query, or that list the query as an
+        alternative. Queries under three characters return every entry.
+        """
+        if len(query) < 3 or len(query_lower) < 3:
+            return self.entries
+        
+        positions = self._containing(self.en, query_lower)
+        positions |= self._containing(self.ar, query)
+        positions |= self.alt_en.get(query_lower, set())
+        positions |= self.alt_ar.get(query, set())
+        return [self.entries[p] for p in sorted(positions)]
+    
+    @staticmethod
+    def _containing(postings: Dict[str, Set[int]], text: str) -> Set[int]:
+        """Positions whose term has every trigram of text."""
+        result: Optional[Set[int]] = None
+        for gram in _trigrams(text):
+            hits = postings.get(gram)
+            if not hits:
+                return set()
+            result = hits.copy() if result is None else result & hits
+        return result or set()
+
+
 class TechnicalGlossary:
     """
     Bilingual technical glossary for academic research.
@@ -65,12 +137,34 @@ class TechnicalGlossary:
     - Domain-specific terminology
     """
     
+    # Maximum memoized lookups per glossary
+    _LOOKUP_CACHE_SIZE = 1024
+    
     def __init__(self):
         """Initialize the glossary."""
         self._entries: Dict[str, GlossaryEntry] = {}
         self._domains: Set[str] = {"general"}
+        # Arabic term and alternative -> entry, built lazily from _entries
+        self._by_ar: Optional[Dict[str, GlossaryEntry]] = None
+        # Trigram index for search, built lazily from _entries
+        self._search_index: Optional[_SearchIndex] = None
+        # Lookup results keyed by (method, args); entries are immutable,
+        # so only add_entry invalidates them
+        self._lookup_cache: Dict[Tuple[Any, ...], Any] = {}
         self._load_default_entries()
     
+    def _cached(self, key: Tuple[Any, ...], compute: Callable[[], T]) -> T:
+        """Return a memoized lookup result, computing it on first use."""
+        cache = self._lookup_cache
+        if key in cache:
+            return cast(T, cache[key])
+        
+        if len(cache) >= self._LOOKUP_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del cache[next(iter(cache))]
+        value = cache[key] = compute()
+        return value
+    
     def _load_default_entries(self) -> None:
         """Load default glossary entries."""
         default_entries = [
@@ -80,7 +174,7 @@ class TechnicalGlossary:
                 term_ar="دولة",
                 domain="political_science",
                 status=TermStatus.APPROVED,
-                alternatives_ar=["سلطة"],
+                alternatives_ar=("سلطة",),
                 usage_notes="Use 'dawla' for modern nation-state concept",
             ),
             GlossaryEntry(
@@ -88,7 +182,7 @@ class TechnicalGlossary:
                 term_ar="حوكمة",
                 domain="political_science",
                 status=TermStatus.PROVISIONAL,
-                alternatives_ar=["إدارة الحكم"],
+                alternatives_ar=("إدارة الحكم",),
                 usage_notes="'Hawkama' is recent; some prefer descriptive phrases",
             ),
             GlossaryEntry(
@@ -96,7 +190,7 @@ class TechnicalGlossary:
                 term_ar="المجتمع المدني",
                 domain="political_science",
                 status=TermStatus.CONTESTED,
-                alternatives_ar=["مجتمع أهلي"],
+                alternatives_ar=("مجتمع أهلي",),
                 usage_notes="Ahli vs Madani distinction reflects different traditions",
             ),
             
@@ -112,7 +206,7 @@ class TechnicalGlossary:
                 term_ar="البحث النوعي",
                 domain="methodology",
                 status=TermStatus.APPROVED,
-                alternatives_ar=["البحث الكيفي"],
+                alternatives_ar=("البحث الكيفي",),
             ),
             GlossaryEntry(
                 term_en="quantitative research",
@@ -131,7 +225,7 @@ class TechnicalGlossary:
                 term_ar="مراجعة الأدبيات",
                 domain="methodology",
                 status=TermStatus.APPROVED,
-                alternatives_ar=["استعراض المراجع"],
+                alternatives_ar=("استعراض المراجع",),
             ),
             
             # Philosophy
@@ -140,14 +234,14 @@ class TechnicalGlossary:
                 term_ar="نظرية المعرفة",
                 domain="philosophy",
                 status=TermStatus.APPROVED,
-                alternatives_ar=["إبستمولوجيا"],
+                alternatives_ar=("إبستمولوجيا",),
             ),
             GlossaryEntry(
                 term_en="ontology",
                 term_ar="الأنطولوجيا",
                 domain="philosophy",
                 status=TermStatus.APPROVED,
-                alternatives_ar=["علم الوجود"],
+                alternatives_ar=("علم الوجود",),
             ),
             
             # Economics
@@ -180,6 +274,9 @@ class TechnicalGlossary:
         key = entry.term_en.lower()
         self._entries[key] = entry
         self._domains.add(entry.domain)
+        self._by_ar = None
+        self._search_index = None
+        self._lookup_cache.clear()
     
     def get_entry(
         self,
@@ -196,16 +293,29 @@ class TechnicalGlossary:
         Returns:
             GlossaryEntry if found, None otherwise
         """
+        return self._cached(
+            ("entry", term, language),
+            lambda: self._find_entry(term, language),
+        )
+    
+    def _find_entry(self, term: str, language: str) -> Optional[GlossaryEntry]:
+        """Look up an entry without the cache."""
         if language == "en":
             key = term.lower()
             return self._entries.get(key)
         
-        # Search Arabic terms
+        if self._by_ar is None:
+            self._by_ar = self._index_arabic_terms()
+        return self._by_ar.get(term)
+    
+    def _index_arabic_terms(self) -> Dict[str, GlossaryEntry]:
+        """Map each Arabic term and alternative to the first entry using it."""
+        by_ar: Dict[str, GlossaryEntry] = {}
         for entry in self._entries.values():
-            if entry.term_ar == term or term in entry.alternatives_ar:
-                return entry
-        
-        return None
+            by_ar.setdefault(entry.term_ar, entry)
+            for alternative in entry.alternatives_ar:
+                by_ar.setdefault(alternative, entry)
+        return by_ar
     
     def search(
         self,
@@ -224,10 +334,26 @@ class TechnicalGlossary:
         Returns:
             List of matching entries
         """
+        return list(self._cached(
+            ("search", query, domain, status),
+            lambda: tuple(self._search(query, domain, status)),
+        ))
+    
+    def _search(
+        self,
+        query: str,
+        domain: Optional[str],
+        status: Optional[TermStatus],
+    ) -> List[GlossaryEntry]:
+        """Search the glossary without the cache."""
         results = []
         query_lower = query.lower()
         
-        for entry in self._entries.values():
+        if self._search_index is None:
+            self._search_index = _SearchIndex.build(self._entries.values())
+        
+        # Only entries sharing the query's trigrams can match
+        for entry in self._search_index.candidates(query, query_lower):
             # Check domain filter
             if domain and entry.domain != domain:
                 continue
@@ -278,7 +404,10 @@ class TechnicalGlossary:
         Returns:
             List of entries in the domain
         """
-        return [e for e in self._entries.values() if e.domain == domain]
+        return list(self._cached(
+            ("domain", domain),
+            lambda: tuple(e for e in self._entries.values() if e.domain == domain),
+        ))
     
     def get_contested(self) -> List[GlossaryEntry]:
         """Get all contested terms."""
@@ -291,10 +420,10 @@ class TechnicalGlossary:
     def export_to_json(self) -> str:
         """Export glossary to JSON."""
         data = {
-            "entries": [e.model_dump(mode="json") for e in self._entries.values()],
+            "entries": list(self._entries.values()),
             "domains": list(self._domains),
         }
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        return to_json(data, indent=2).decode()
     
     @classmethod
     def from_json(cls, json_str: str) -> "TechnicalGlossary":
@@ -302,6 +431,9 @@ class TechnicalGlossary:
         data = json.loads(json_str)
         glossary = cls()
         glossary._entries.clear()
+        glossary._by_ar = None
+        glossary._search_index = None
+        glossary._lookup_cache.clear()
         
         for entry_data in data.get("entries", []):
             entry = GlossaryEntry(**entry_data)
@@ -5,8 +5,10 @@ Defines research paradigms and provides methodology-aware
 guidance for research analysis.
 """
 
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
+from operator import attrgetter
 from pydantic import BaseModel, Field
 
 
@@ -49,6 +51,13 @@ class ParadigmDescription(BaseModel):
     limitations: List[str]
 
 
+# Description accessors keyed by language code (English is the fallback)
+_DESCRIPTION_BY_LANG = {
+    "en": attrgetter("description_en"),
+    "ar": attrgetter("description_ar"),
+}
+
+
 class MethodologyFramework:
     """
     Framework for methodology awareness.
@@ -57,9 +66,14 @@ class MethodologyFramework:
     different research paradigms.
     """
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the framework."""
         self._paradigms = self._load_paradigms()
+        self._compare_views = self._build_compare_views()
+        # (complementary, tensions) per ordered paradigm pair
+        self._pair_findings: Dict[
+            Tuple[ResearchParadigm, ResearchParadigm], Tuple[Tuple[str, ...], Tuple[str, ...]]
+        ] = {}
     
     def _load_paradigms(self) -> Dict[ResearchParadigm, ParadigmDescription]:
         """Load paradigm descriptions."""
@@ -213,6 +227,19 @@ class MethodologyFramework:
             ),
         }
     
+    def _build_compare_views(self) -> Dict[Tuple[ResearchParadigm, str], Dict[str, Any]]:
+        """Precompute per-language comparison views of each paradigm."""
+        return {
+            (paradigm, language): {
+                "name": desc.name_ar if language == "ar" else desc.name_en,
+                "ontology": desc.ontology,
+                "epistemology": desc.epistemology,
+                "strengths": tuple(desc.strengths),
+            }
+            for paradigm, desc in self._paradigms.items()
+            for language in ("en", "ar")
+        }
+    
     def get_paradigm(self, paradigm: ResearchParadigm) -> Optional[ParadigmDescription]:
         """Get description of a paradigm."""
         return self._paradigms.get(paradigm)
@@ -249,26 +276,30 @@ class MethodologyFramework:
         if not desc_a or not desc_b:
             return {"error": "Paradigm not found"}
         
-        name_key = f"name_{language}"
-        desc_key = f"description_{language}"
+        if language != "ar":
+            language = "en"
+        
+        # Pair findings depend only on the ordered pair, not the language
+        findings = self._pair_findings.get((paradigm_a, paradigm_b))
+        if findings is None:
+            findings = self._pair_findings[(paradigm_a, paradigm_b)] = (
+                tuple(self._find_complementary(desc_a, desc_b)),
+                tuple(self._find_tensions(desc_a, desc_b)),
+            )
+        complementary, tensions = findings
         
         return {
-            "paradigm_a": {
-                "name": getattr(desc_a, name_key, desc_a.name_en),
-                "ontology": desc_a.ontology,
-                "epistemology": desc_a.epistemology,
-                "strengths": desc_a.strengths,
-            },
-            "paradigm_b": {
-                "name": getattr(desc_b, name_key, desc_b.name_en),
-                "ontology": desc_b.ontology,
-                "epistemology": desc_b.epistemology,
-                "strengths": desc_b.strengths,
-            },
-            "complementary_aspects": self._find_complementary(desc_a, desc_b),
-            "tensions": self._find_tensions(desc_a, desc_b),
+            "paradigm_a": self._compare_view(paradigm_a, language),
+            "paradigm_b": self._compare_view(paradigm_b, language),
+            "complementary_aspects": list(complementary),
+            "tensions": list(tensions),
         }
     
+    def _compare_view(self, paradigm: ResearchParadigm, language: str) -> Dict[str, Any]:
+        """Fresh copy of a precomputed view, safe for callers to modify."""
+        view = self._compare_views[(paradigm, language)]
+        return {**view, "strengths": list(view["strengths"])}
+    
     def _find_complementary(
         self,
         a: ParadigmDescription,
@@ -303,6 +334,12 @@ class MethodologyFramework:
         return tensions
 
 
+@functools.lru_cache(maxsize=1)
+def _default_framework() -> MethodologyFramework:
+    """Shared framework for module-level lookups, built on first use."""
+    return MethodologyFramework()
+
+
 def get_paradigm_description(
     paradigm: ResearchParadigm,
     language: str = "en",
@@ -317,12 +354,11 @@ def get_paradigm_description(
     Returns:
         Description text
     """
-    framework = MethodologyFramework()
-    desc = framework.get_paradigm(paradigm)
+    desc = _default_framework().get_paradigm(paradigm)
     
     if not desc:
         return "Unknown paradigm"
     
-    if language == "ar":
-        return desc.description_ar
-    return desc.description_en
+    get_description = _DESCRIPTION_BY_LANG.get(language, _DESCRIPTION_BY_LANG["en"])
+    description: str = get_description(desc)
+    return description
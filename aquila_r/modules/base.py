@@ -5,11 +5,17 @@ Provides the foundational abstractions that all research
 modules must implement.
 """
 
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from bisect import bisect_right
+from itertools import islice
+from typing import Dict, List, Optional, Any, Iterator, FrozenSet, Mapping, Sequence, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from pydantic import BaseModel, Field
+from types import MappingProxyType
+import numpy as np
+from pydantic import BaseModel, Field, TypeAdapter, computed_field, model_validator
 
 
 class ModuleStatus(str, Enum):
@@ -32,47 +38,81 @@ class ConfidenceLevel(str, Enum):
     @classmethod
     def from_score(cls, score: float) -> "ConfidenceLevel":
         """Convert numeric score to confidence level."""
-        if score >= 0.9:
-            return cls.VERY_HIGH
-        elif score >= 0.7:
-            return cls.HIGH
-        elif score >= 0.5:
-            return cls.MEDIUM
-        elif score >= 0.3:
-            return cls.LOW
-        return cls.VERY_LOW
+        if score != score:
+            # NaN compares false with every threshold, as in the old if-chain
+            return cls.VERY_LOW
+        return _CONFIDENCE_LEVELS[bisect_right(_CONFIDENCE_THRESHOLDS, score)]
 
 
-class Finding(BaseModel):
-    """A research finding from a module."""
+# Lower bounds of each level above VERY_LOW, ascending. Kept outside the
+# enum body so they do not become members.
+_CONFIDENCE_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+_CONFIDENCE_LEVELS = (
+    ConfidenceLevel.VERY_LOW,
+    ConfidenceLevel.LOW,
+    ConfidenceLevel.MEDIUM,
+    ConfidenceLevel.HIGH,
+    ConfidenceLevel.VERY_HIGH,
+)
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+# Parses executed_at values the way a datetime field would
+_DATETIME = TypeAdapter(datetime)
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+
+@dataclass(slots=True)
+class Finding:
+    """
+    A research finding from a module.
     
-    content: str = Field(description="The finding content")
-    confidence: float = Field(ge=0.0, le=1.0)
-    source_id: Optional[str] = Field(default=None)
-    evidence_type: str = Field(default="general")
-    language: str = Field(default="en")
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    Plain slotted dataclass: findings are produced internally in
+    bulk, so they skip Pydantic validation on construction.
+    """
+    
+    content: str  # The finding content
+    confidence: float  # 0.0-1.0
+    source_id: Optional[str] = None
+    evidence_type: str = "general"
+    language: str = "en"
+    metadata: Optional[Dict[str, Any]] = None
+    
+    def __post_init__(self) -> None:
+        """Reject confidences outside 0-1, as the Pydantic model did."""
+        if not 0.0 <= self.confidence <= 1.0:
+            raise ValueError(
+                f"confidence must be between 0 and 1, got {self.confidence}"
+            )
     
     @property
     def confidence_level(self) -> ConfidenceLevel:
         """Get confidence as categorical level."""
         return ConfidenceLevel.from_score(self.confidence)
+    
+    @property
+    def metadata_view(self) -> Mapping[str, Any]:
+        """Read-only metadata, shared empty mapping when none is attached."""
+        return self.metadata if self.metadata is not None else _EMPTY_METADATA
 
 
-class Warning(BaseModel):
+@dataclass(slots=True)
+class Warning:
     """A warning or caveat from module execution."""
     
-    message: str = Field(description="Warning message")
-    severity: str = Field(default="medium")  # low, medium, high
-    category: str = Field(default="general")
+    message: str
+    severity: str = "medium"  # low, medium, high
+    category: str = "general"
 
 
-class Limitation(BaseModel):
+@dataclass(slots=True)
+class Limitation:
     """An identified limitation."""
     
-    description: str = Field(description="Limitation description")
-    impact: str = Field(default="medium")  # low, medium, high
-    mitigation: Optional[str] = Field(default=None)
+    description: str
+    impact: str = "medium"  # low, medium, high
+    mitigation: Optional[str] = None
 
 
 class ModuleResult(BaseModel):
@@ -88,15 +128,70 @@ class ModuleResult(BaseModel):
     language: str = Field(default="en")
     methodology_notes: List[str] = Field(default_factory=list)
     raw_data: Optional[Dict[str, Any]] = Field(default=None)
-    executed_at: datetime = Field(default_factory=datetime.utcnow)
+    # Unix epoch, ns; serialized only through the executed_at view
+    executed_at_ns: int = Field(default_factory=time.time_ns, exclude=True)
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _executed_at_to_ns(cls, data: Any) -> Any:
+        """
+        Accept executed_at on input, as when it was a stored field.
+        
+        Aware datetimes are converted to UTC; naive ones are taken as
+        UTC. An explicit executed_at_ns takes precedence.
+        """
+        if isinstance(data, dict) and "executed_at" in data:
+            data = dict(data)
+            value = _DATETIME.validate_python(data.pop("executed_at"))
+            if value.tzinfo is not None:
+                value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            data.setdefault(
+                "executed_at_ns", (value - _EPOCH) // timedelta(microseconds=1) * 1000
+            )
+        return data
+    
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def executed_at(self) -> datetime:
+        """Execution time as a naive UTC datetime, built on access."""
+        return _EPOCH + timedelta(microseconds=self.executed_at_ns // 1000)
+    
+    def confidence_histogram(self) -> Dict[str, int]:
+        """
+        Count findings per confidence level.
+        
+        Returns:
+            Mapping of confidence level value to number of findings
+        """
+        # Read from findings on every call so in-place edits are counted
+        scores = np.fromiter(
+            (f.confidence for f in self.findings),
+            dtype=np.float64,
+            count=len(self.findings),
+        )
+        bins = np.searchsorted(_CONFIDENCE_THRESHOLDS, scores, side="right")
+        # searchsorted places NaN last; count it as VERY_LOW like from_score
+        bins[np.isnan(scores)] = 0
+        counts = np.bincount(bins, minlength=len(_CONFIDENCE_LEVELS))
+        return {
+            level.value: int(n) for level, n in zip(_CONFIDENCE_LEVELS, counts, strict=True)
+        }
+    
+    def iter_high_confidence_findings(self) -> Iterator[Finding]:
+        """Iterate lazily over findings with high or very high confidence."""
+        return (f for f in self.findings if f.confidence >= 0.7)
     
     def get_high_confidence_findings(self) -> List[Finding]:
         """Get findings with high or very high confidence."""
-        return [f for f in self.findings if f.confidence >= 0.7]
+        return list(self.iter_high_confidence_findings())
+    
+    def iter_warnings_by_severity(self, severity: str) -> Iterator[Warning]:
+        """Iterate lazily over warnings of specific severity."""
+        return (w for w in self.warnings if w.severity == severity)
     
     def get_warnings_by_severity(self, severity: str) -> List[Warning]:
         """Get warnings of specific severity."""
-        return [w for w in self.warnings if w.severity == severity]
+        return list(self.iter_warnings_by_severity(severity))
     
     def to_summary(self, lang: str = "en") -> str:
         """Generate a summary of the result."""
@@ -106,47 +201,55 @@ class ModuleResult(BaseModel):
     
     def _to_english_summary(self) -> str:
         """Generate English summary."""
-        lines = [f"## {self.module_name} Results\n"]
-        lines.append(f"Status: {self.status.value}\n")
-        lines.append(f"Findings: {len(self.findings)}\n")
+        parts = [
+            f"## {self.module_name} Results\n"
+            f"Status: {self.status.value}\n"
+            f"Findings: {len(self.findings)}\n"
+        ]
         
         if self.findings:
-            lines.append("\n### Key Findings:\n")
-            for i, f in enumerate(self.findings[:5], 1):
+            parts.append("\n### Key Findings:\n")
+            for i, f in enumerate(islice(self.findings, 5), 1):
                 conf = f.confidence_level.value
-                lines.append(f"{i}. [{conf}] {f.content[:200]}...\n")
+                parts.append(f"{i}. [{conf}] {f.content[:200]}...\n")
         
         if self.warnings:
-            lines.append(f"\n⚠️ Warnings: {len(self.warnings)}\n")
+            parts.append(f"\n⚠️ Warnings: {len(self.warnings)}\n")
         
         if self.limitations:
-            lines.append(f"\n📋 Limitations: {len(self.limitations)}\n")
+            parts.append(f"\n📋 Limitations: {len(self.limitations)}\n")
         
-        return "".join(lines)
+        return "".join(parts)
     
     def _to_arabic_summary(self) -> str:
         """Generate Arabic summary."""
-        lines = [f"## نتائج {self.module_name}\n"]
-        lines.append(f"الحالة: {self.status.value}\n")
-        lines.append(f"النتائج: {len(self.findings)}\n")
+        parts = [
+            f"## نتائج {self.module_name}\n"
+            f"الحالة: {self.status.value}\n"
+            f"النتائج: {len(self.findings)}\n"
+        ]
         
         if self.findings:
-            lines.append("\n### النتائج الرئيسية:\n")
-            for i, f in enumerate(self.findings[:5], 1):
-                lines.append(f"{i}. {f.content[:200]}...\n")
+            parts.append("\n### النتائج الرئيسية:\n")
+            for i, f in enumerate(islice(self.findings, 5), 1):
+                parts.append(f"{i}. {f.content[:200]}...\n")
         
-        return "".join(lines)
+        return "".join(parts)
 
 
-class ModuleContext(BaseModel):
+@dataclass(slots=True)
+class ModuleContext:
     """Context passed to module during execution."""
     
-    query: str = Field(description="Research query")
-    language: str = Field(default="en")
-    methodology: str = Field(default="mixed")
-    max_sources: int = Field(default=20)
-    previous_findings: List[Finding] = Field(default_factory=list)
-    constraints: Dict[str, Any] = Field(default_factory=dict)
+    query: str  # Research query
+    language: str = "en"
+    methodology: str = "mixed"
+    max_sources: int = 20
+    previous_findings: List[Finding] = field(default_factory=list)
+    constraints: Dict[str, Any] = field(default_factory=dict)
+
+
+_NO_ISSUES: Tuple[str, ...] = ()
 
 
 class BaseModule(ABC):
@@ -160,6 +263,12 @@ class BaseModule(ABC):
     name: str = "base_module"
     description: str = "Base module"
     supported_languages: List[str] = ["en", "ar"]
+    _supported_languages_set: FrozenSet[str] = frozenset(supported_languages)
+    
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute each subclass's supported languages as a frozenset."""
+        super().__init_subclass__(**kwargs)
+        cls._supported_languages_set = frozenset(cls.supported_languages)
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -184,7 +293,7 @@ class BaseModule(ABC):
         """
         pass
     
-    def validate_context(self, context: ModuleContext) -> List[str]:
+    def validate_context(self, context: ModuleContext) -> Sequence[str]:
         """
         Validate the execution context.
         
@@ -192,14 +301,17 @@ class BaseModule(ABC):
             context: Context to validate
             
         Returns:
-            List of validation issues (empty if valid)
+            Validation issues (empty if valid)
         """
+        if context.language in self._supported_languages_set and context.query.strip():
+            return _NO_ISSUES
+        
         issues = []
         
         if not context.query.strip():
             issues.append("Query cannot be empty")
         
-        if context.language not in self.supported_languages:
+        if context.language not in self._supported_languages_set:
             issues.append(
                 f"Language '{context.language}' not supported. "
                 f"Supported: {self.supported_languages}"
@@ -211,10 +323,11 @@ class BaseModule(ABC):
         self,
         content: str,
         confidence: float,
+        *,
         source_id: Optional[str] = None,
         evidence_type: str = "general",
         language: str = "en",
-        **metadata,
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> Finding:
         """
         Create a finding with proper structure.
@@ -225,19 +338,13 @@ class BaseModule(ABC):
             source_id: Optional source reference
             evidence_type: Type of evidence
             language: Content language
-            **metadata: Additional metadata
+            metadata: Additional metadata; adopted by reference, so the
+                caller must not mutate it afterwards
             
         Returns:
             Structured Finding object
         """
-        return Finding(
-            content=content,
-            confidence=confidence,
-            source_id=source_id,
-            evidence_type=evidence_type,
-            language=language,
-            metadata=metadata,
-        )
+        return Finding(content, confidence, source_id, evidence_type, language, metadata)
     
     def create_warning(
         self,
@@ -246,11 +353,7 @@ class BaseModule(ABC):
         category: str = "general",
     ) -> Warning:
         """Create a warning."""
-        return Warning(
-            message=message,
-            severity=severity,
-            category=category,
-        )
+        return Warning(message, severity, category)
     
     def create_limitation(
         self,
@@ -259,11 +362,7 @@ class BaseModule(ABC):
         mitigation: Optional[str] = None,
     ) -> Limitation:
         """Create a limitation note."""
-        return Limitation(
-            description=description,
-            impact=impact,
-            mitigation=mitigation,
-        )
+        return Limitation(description, impact, mitigation)
     
     def _empty_result(self, status: ModuleStatus = ModuleStatus.COMPLETED) -> ModuleResult:
         """Create an empty result."""
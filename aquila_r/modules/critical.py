@@ -8,10 +8,15 @@ Responsible for:
 - Highlighting weak or unsupported claims
 """
 
-from typing import Dict, List, Optional, Any
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, compress
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from pydantic import BaseModel, Field
 
+from aquila_r._terms import contains_any, term_scanner, terms_in
 from aquila_r.modules.base import (
     BaseModule,
     ModuleContext,
@@ -21,6 +26,58 @@ from aquila_r.modules.base import (
 )
 
 
+# Term lists used by the critical evaluation scanners
+_OVERSTATEMENT_TERMS = (
+    "proves", "definitively", "certainly", "undoubtedly",
+    "clearly shows", "without question", "obviously",
+)
+_CONDITIONAL_TERMS = ("all", "every", "always", "never", "none")
+_WESTERN_CENTRIC_TERMS = (
+    "the west", "western values", "developed countries",
+    "modern societies", "advanced nations",
+)
+_LIMITATION_TERMS = ("limitation", "constraint", "caveat", "weakness")
+
+_LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+
+
+def _fast_lower(text: str) -> str:
+    """Lowercase text, using a byte-table fold when it is pure ASCII."""
+    try:
+        return text.encode("ascii").translate(_LOWER_TABLE).decode("ascii")
+    except UnicodeEncodeError:
+        # Arabic and other non-ASCII text
+        return text.lower()
+
+
+def _flag_overstated(claims: List[str]) -> List[bool]:
+    """
+    Flag claims containing an overstatement term in one regex pass.
+    
+    Claims are packed into a single newline-separated buffer with their
+    start offsets, so the scan runs once in C over the whole batch
+    instead of once per claim. No term contains a newline, so matches
+    never span two claims.
+    """
+    flags = [False] * len(claims)
+    if not claims:
+        return flags
+    
+    buffer = "\n".join(claims)
+    try:
+        buffer = buffer.encode("ascii").translate(_LOWER_TABLE).decode("ascii")
+    except UnicodeEncodeError:
+        # str.lower() can change length, so fold each claim separately
+        claims = [claim.lower() for claim in claims]
+        buffer = "\n".join(claims)
+    
+    starts = list(accumulate((len(claim) + 1 for claim in claims[:-1]), initial=0))
+    pattern, _ = term_scanner(_OVERSTATEMENT_TERMS)
+    for match in pattern.finditer(buffer):
+        flags[bisect_right(starts, match.start()) - 1] = True
+    return flags
+
+
 class BiasType(str, Enum):
     """Types of bias to detect."""
     IDEOLOGICAL = "ideological"
@@ -54,27 +111,29 @@ class LogicalFallacy(str, Enum):
     FALSE_EQUIVALENCE = "false_equivalence"
 
 
-class BiasIndicator(BaseModel):
+@dataclass(slots=True)
+class BiasIndicator:
     """An identified bias indicator."""
     
     bias_type: BiasType
     description: str
-    severity: str = Field(default="medium")  # low, medium, high
-    evidence: str = Field(default="")
+    severity: str = "medium"  # low, medium, high
+    evidence: str = ""
     source_id: Optional[str] = None
 
 
-class ArgumentEvaluation(BaseModel):
+@dataclass(slots=True)
+class ArgumentEvaluation:
     """Evaluation of an argument."""
     
     claim: str
     strength: ArgumentStrength
-    evidence_provided: bool = Field(default=False)
-    evidence_quality: str = Field(default="unknown")
-    logical_issues: List[str] = Field(default_factory=list)
-    fallacies: List[LogicalFallacy] = Field(default_factory=list)
-    assumptions: List[str] = Field(default_factory=list)
-    counter_evidence: List[str] = Field(default_factory=list)
+    evidence_provided: bool = False
+    evidence_quality: str = "unknown"
+    logical_issues: List[str] = field(default_factory=list)
+    fallacies: List[LogicalFallacy] = field(default_factory=list)
+    assumptions: List[str] = field(default_factory=list)
+    counter_evidence: List[str] = field(default_factory=list)
 
 
 class MethodologicalAssessment(BaseModel):
@@ -100,19 +159,13 @@ class CriticalResult(ModuleResult):
     
     def get_argument_summary(self) -> Dict[str, int]:
         """Summarize arguments by strength."""
-        summary: Dict[str, int] = {}
-        for arg in self.arguments:
-            strength = arg.strength.value
-            summary[strength] = summary.get(strength, 0) + 1
-        return summary
+        counts = Counter(arg.strength for arg in self.arguments)
+        return {strength.value: n for strength, n in counts.items()}
     
     def get_bias_summary(self) -> Dict[str, int]:
         """Summarize biases by type."""
-        summary: Dict[str, int] = {}
-        for bias in self.biases:
-            b_type = bias.bias_type.value
-            summary[b_type] = summary.get(b_type, 0) + 1
-        return summary
+        counts = Counter(bias.bias_type for bias in self.biases)
+        return {b_type.value: n for b_type, n in counts.items()}
 
 
 class CriticalModule(BaseModule):
@@ -206,27 +259,21 @@ class CriticalModule(BaseModule):
             evidence_quality=evidence_quality,
         )
         
+        claim_lower = _fast_lower(claim)
+        
         # Check for overstatement indicators
-        overstatement_terms = [
-            "proves", "definitively", "certainly", "undoubtedly",
-            "clearly shows", "without question", "obviously"
-        ]
-        claim_lower = claim.lower()
-        for term in overstatement_terms:
-            if term in claim_lower:
-                evaluation.logical_issues.append(
-                    f"Potential overstatement: '{term}' used without sufficient qualification"
-                )
-                if strength == ArgumentStrength.MODERATE:
-                    evaluation.strength = ArgumentStrength.WEAK
+        for term in terms_in(_OVERSTATEMENT_TERMS, claim_lower):
+            evaluation.logical_issues.append(
+                f"Potential overstatement: '{term}' used without sufficient qualification"
+            )
+            if strength == ArgumentStrength.MODERATE:
+                evaluation.strength = ArgumentStrength.WEAK
         
         # Express assumptions if claim contains implicit conditions
-        conditional_terms = ["all", "every", "always", "never", "none"]
-        for term in conditional_terms:
-            if term in claim_lower:
-                evaluation.assumptions.append(
-                    f"Universal claim ('{term}') assumes no exceptions exist"
-                )
+        for term in terms_in(_CONDITIONAL_TERMS, claim_lower):
+            evaluation.assumptions.append(
+                f"Universal claim ('{term}') assumes no exceptions exist"
+            )
         
         return evaluation
     
@@ -246,21 +293,15 @@ class CriticalModule(BaseModule):
             List of identified bias indicators
         """
         biases = []
-        content_lower = content.lower()
         
         # Geographic bias indicators
-        western_centric_terms = [
-            "the west", "western values", "developed countries",
-            "modern societies", "advanced nations"
-        ]
-        for term in western_centric_terms:
-            if term in content_lower:
-                biases.append(BiasIndicator(
-                    bias_type=BiasType.GEOGRAPHIC,
-                    description=f"Potential Western-centric framing detected: '{term}'",
-                    severity="medium",
-                    evidence=f"Term '{term}' found in content",
-                ))
+        for term in terms_in(_WESTERN_CENTRIC_TERMS, _fast_lower(content)):
+            biases.append(BiasIndicator(
+                bias_type=BiasType.GEOGRAPHIC,
+                description=f"Potential Western-centric framing detected: '{term}'",
+                severity="medium",
+                evidence=f"Term '{term}' found in content",
+            ))
         
         # Language bias
         if source_metadata:
@@ -322,9 +363,8 @@ class CriticalModule(BaseModule):
         
         # Check for limitations acknowledgment
         if methodology_text:
-            limitation_terms = ["limitation", "constraint", "caveat", "weakness"]
-            assessment.limitations_acknowledged = any(
-                term in methodology_text.lower() for term in limitation_terms
+            assessment.limitations_acknowledged = (
+                contains_any(_LIMITATION_TERMS, _fast_lower(methodology_text))
             )
             
             if not assessment.limitations_acknowledged:
@@ -348,25 +388,60 @@ class CriticalModule(BaseModule):
     def identify_weak_claims(
         self,
         claims: List[str],
+        evidence: Optional[List[Optional[str]]] = None,
     ) -> tuple[List[str], List[str]]:
         """
         Identify weak and unsupported claims.
         
+        Classifies claims with the same rules as evaluate_argument
+        without building an ArgumentEvaluation for each one.
+        
         Args:
             claims: List of claims to evaluate
+            evidence: Evidence for each claim, aligned with claims
             
         Returns:
             Tuple of (weak_claims, unsupported_claims)
+            
+        Raises:
+            ValueError: If evidence is given but not aligned with claims
         """
-        weak_claims = []
+        if evidence is None:
+            # Without evidence every claim is unsupported
+            return [], list(claims)
+        
+        supported = []
         unsupported_claims = []
         
-        for claim in claims:
-            evaluation = self.evaluate_argument(claim)
-            
-            if evaluation.strength == ArgumentStrength.UNSUPPORTED:
+        if len(evidence) != len(claims):
+            raise ValueError(
+                f"evidence must align with claims: got {len(evidence)} "
+                f"evidence entries for {len(claims)} claims"
+            )
+        
+        for claim, claim_evidence in zip(claims, evidence, strict=True):
+            if claim_evidence is None or not claim_evidence.strip():
                 unsupported_claims.append(claim)
-            elif evaluation.strength == ArgumentStrength.WEAK:
-                weak_claims.append(claim)
+            else:
+                supported.append(claim)
+        
+        weak_claims = list(compress(supported, _flag_overstated(supported)))
         
         return weak_claims, unsupported_claims
+    
+    def identify_weak_claims_with_evidence(
+        self,
+        pairs: List[Tuple[str, Optional[str]]],
+    ) -> tuple[List[str], List[str]]:
+        """
+        Identify weak and unsupported claims from (claim, evidence) pairs.
+        
+        Args:
+            pairs: Claims paired with their evidence
+            
+        Returns:
+            Tuple of (weak_claims, unsupported_claims)
+        """
+        claims = [claim for claim, _ in pairs]
+        evidence = [claim_evidence for _, claim_evidence in pairs]
+        return self.identify_weak_claims(claims, evidence)
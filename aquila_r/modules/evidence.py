@@ -7,10 +7,12 @@ Responsible for:
 - Avoiding causal claims without justification
 """
 
-from typing import Dict, List, Optional, Any, Union
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Any, Union
 from enum import Enum
-from pydantic import BaseModel, Field
-import json
+from pydantic import Field
+import numpy as np
 
 from aquila_r.modules.base import (
     BaseModule,
@@ -40,16 +42,18 @@ class CausalClaim(str, Enum):
     PREDICTION = "prediction"
 
 
-class DataLimitation(BaseModel):
+@dataclass(slots=True)
+class DataLimitation:
     """A limitation in the data."""
     
     description: str
-    severity: str = Field(default="medium")
-    affected_conclusions: List[str] = Field(default_factory=list)
+    severity: str = "medium"
+    affected_conclusions: List[str] = field(default_factory=list)
     mitigation: Optional[str] = None
 
 
-class StatisticalFinding(BaseModel):
+@dataclass(slots=True)
+class StatisticalFinding:
     """A statistical finding from data analysis."""
     
     metric: str
@@ -59,19 +63,20 @@ class StatisticalFinding(BaseModel):
     sample_size: Optional[int] = None
     p_value: Optional[float] = None
     effect_size: Optional[float] = None
-    limitations: List[str] = Field(default_factory=list)
+    limitations: List[str] = field(default_factory=list)
 
 
-class CausalAnalysis(BaseModel):
+@dataclass(slots=True)
+class CausalAnalysis:
     """Analysis of a causal claim."""
     
     claim: str
     claim_type: CausalClaim
-    justified: bool = Field(default=False)
+    justified: bool = False
     justification: Optional[str] = None
-    alternative_explanations: List[str] = Field(default_factory=list)
-    confounders: List[str] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
+    alternative_explanations: List[str] = field(default_factory=list)
+    confounders: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
 
 
 class EvidenceResult(ModuleResult):
@@ -100,6 +105,88 @@ class EvidenceModule(BaseModule):
     description = "Data analysis, statistical reasoning, and causal claim validation"
     supported_languages = ["en", "ar"]
     
+    # Causal language, matched case-insensitively in one pass
+    _CAUSAL_RE = re.compile(
+        "causes|leads to|results in|produces|determines|creates|generates|makes",
+        re.IGNORECASE,
+    )
+    
+    # Fixed causal-validation messages
+    _EXPERIMENTAL_JUSTIFICATION = (
+        "Experimental design with randomization and control group "
+        "supports causal inference."
+    )
+    _WARN_NO_RANDOMIZATION = (
+        "Control group present but no randomization; "
+        "claim is associative, not causal."
+    )
+    _WARN_OBSERVATIONAL = (
+        "Observational data without control group; "
+        "correlation does not imply causation."
+    )
+    _OBSERVATIONAL_ALTERNATIVES = (
+        "Reverse causation: outcome may cause the predictor",
+        "Omitted variable bias: unobserved factors may explain relationship",
+    )
+    
+    # (randomized, controlled, experimental) ->
+    # (claim type, justified, justification, design warning)
+    _CLAIM_TABLE = {
+        (True, True, True): (
+            CausalClaim.CAUSATION, True, _EXPERIMENTAL_JUSTIFICATION, None,
+        ),
+        (True, True, False): (CausalClaim.ASSOCIATION, False, None, None),
+        (False, True, True): (
+            CausalClaim.ASSOCIATION, False, None, _WARN_NO_RANDOMIZATION,
+        ),
+        (False, True, False): (
+            CausalClaim.ASSOCIATION, False, None, _WARN_NO_RANDOMIZATION,
+        ),
+        (True, False, True): (
+            CausalClaim.CORRELATION, False, None, _WARN_OBSERVATIONAL,
+        ),
+        (True, False, False): (
+            CausalClaim.CORRELATION, False, None, _WARN_OBSERVATIONAL,
+        ),
+        (False, False, True): (
+            CausalClaim.CORRELATION, False, None, _WARN_OBSERVATIONAL,
+        ),
+        (False, False, False): (
+            CausalClaim.CORRELATION, False, None, _WARN_OBSERVATIONAL,
+        ),
+    }
+    
+    # Data limitation builders keyed by severity band
+    _SAMPLE_LIMITATIONS: Dict[str, Callable[[int], DataLimitation]] = {
+        "high": lambda n: DataLimitation(
+            description=f"Very small sample size (n={n}); "
+                       "statistical power is severely limited",
+            severity="high",
+            affected_conclusions=["All statistical inferences"],
+            mitigation="Interpret findings as exploratory only",
+        ),
+        "medium": lambda n: DataLimitation(
+            description=f"Small sample size (n={n}); "
+                       "subgroup analyses may be unreliable",
+            severity="medium",
+            mitigation="Avoid subgroup analyses; focus on main effects",
+        ),
+    }
+    _MISSING_LIMITATIONS: Dict[str, Callable[[float], DataLimitation]] = {
+        "high": lambda rate: DataLimitation(
+            description=f"High missing data rate ({rate:.0%}); "
+                       "results may be biased",
+            severity="high",
+            affected_conclusions=["Estimates may not represent full population"],
+            mitigation="Consider multiple imputation or sensitivity analysis",
+        ),
+        "medium": lambda rate: DataLimitation(
+            description=f"Moderate missing data ({rate:.0%})",
+            severity="medium",
+            mitigation="Report missingness patterns",
+        ),
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
     
@@ -157,32 +244,21 @@ class EvidenceModule(BaseModule):
         Returns:
             CausalAnalysis with validation results
         """
-        analysis = CausalAnalysis(claim=claim, claim_type=CausalClaim.CORRELATION)
         confounders = potential_confounders or []
         
         # Determine claim type based on evidence
-        if has_randomization and has_control_group:
-            if evidence_type == EvidenceType.EXPERIMENTAL:
-                analysis.claim_type = CausalClaim.CAUSATION
-                analysis.justified = True
-                analysis.justification = (
-                    "Experimental design with randomization and control group "
-                    "supports causal inference."
-                )
-            else:
-                analysis.claim_type = CausalClaim.ASSOCIATION
-        elif has_control_group:
-            analysis.claim_type = CausalClaim.ASSOCIATION
-            analysis.warnings.append(
-                "Control group present but no randomization; "
-                "claim is associative, not causal."
-            )
-        else:
-            analysis.claim_type = CausalClaim.CORRELATION
-            analysis.warnings.append(
-                "Observational data without control group; "
-                "correlation does not imply causation."
-            )
+        claim_type, justified, justification, design_warning = self._CLAIM_TABLE[(
+            bool(has_randomization),
+            bool(has_control_group),
+            evidence_type == EvidenceType.EXPERIMENTAL,
+        )]
+        analysis = CausalAnalysis(
+            claim=claim,
+            claim_type=claim_type,
+            justified=justified,
+            justification=justification,
+            warnings=[design_warning] if design_warning else [],
+        )
         
         # Check sample size
         if sample_size is not None and sample_size < 30:
@@ -201,12 +277,7 @@ class EvidenceModule(BaseModule):
         
         # Add alternative explanations
         if evidence_type == EvidenceType.OBSERVATIONAL:
-            analysis.alternative_explanations.append(
-                "Reverse causation: outcome may cause the predictor"
-            )
-            analysis.alternative_explanations.append(
-                "Omitted variable bias: unobserved factors may explain relationship"
-            )
+            analysis.alternative_explanations.extend(self._OBSERVATIONAL_ALTERNATIVES)
         
         return analysis
     
@@ -231,42 +302,30 @@ class EvidenceModule(BaseModule):
         Returns:
             List of identified limitations
         """
-        limitations = []
-        
-        # Sample size assessment
+        # Classify severity bands first; most inputs fall in neither
+        sample_band = None
         if sample_size is not None:
             if sample_size < 30:
-                limitations.append(DataLimitation(
-                    description=f"Very small sample size (n={sample_size}); "
-                               "statistical power is severely limited",
-                    severity="high",
-                    affected_conclusions=["All statistical inferences"],
-                    mitigation="Interpret findings as exploratory only",
-                ))
+                sample_band = "high"
             elif sample_size < 100:
-                limitations.append(DataLimitation(
-                    description=f"Small sample size (n={sample_size}); "
-                               "subgroup analyses may be unreliable",
-                    severity="medium",
-                    mitigation="Avoid subgroup analyses; focus on main effects",
-                ))
+                sample_band = "medium"
         
-        # Missing data
-        if missing_rate is not None and missing_rate > 0:
+        missing_band = None
+        if missing_rate is not None:
             if missing_rate > 0.2:
-                limitations.append(DataLimitation(
-                    description=f"High missing data rate ({missing_rate:.0%}); "
-                               "results may be biased",
-                    severity="high",
-                    affected_conclusions=["Estimates may not represent full population"],
-                    mitigation="Consider multiple imputation or sensitivity analysis",
-                ))
+                missing_band = "high"
             elif missing_rate > 0.05:
-                limitations.append(DataLimitation(
-                    description=f"Moderate missing data ({missing_rate:.0%})",
-                    severity="medium",
-                    mitigation="Report missingness patterns",
-                ))
+                missing_band = "medium"
+        
+        if sample_band is None and missing_band is None:
+            return []
+        
+        # A band implies its value was given; the None checks narrow types
+        limitations = []
+        if sample_band is not None and sample_size is not None:
+            limitations.append(self._SAMPLE_LIMITATIONS[sample_band](sample_size))
+        if missing_band is not None and missing_rate is not None:
+            limitations.append(self._MISSING_LIMITATIONS[missing_band](missing_rate))
         
         return limitations
     
@@ -285,31 +344,16 @@ class EvidenceModule(BaseModule):
         Returns:
             List of unjustified claims
         """
-        unjustified = []
+        # Causal claims are justified by experimental evidence
+        if evidence_available.get("experimental", False):
+            return []
         
-        causal_indicators = [
-            "causes", "leads to", "results in", "produces",
-            "determines", "creates", "generates", "makes"
+        search = self._CAUSAL_RE.search
+        return [
+            f"CAUSAL CLAIM WITHOUT EXPERIMENTAL EVIDENCE: {claim}"
+            for claim in claims
+            if search(claim)
         ]
-        
-        for claim in claims:
-            claim_lower = claim.lower()
-            
-            # Check for causal language
-            has_causal_language = any(
-                indicator in claim_lower for indicator in causal_indicators
-            )
-            
-            if has_causal_language:
-                # Check if experimental evidence exists
-                has_experimental = evidence_available.get("experimental", False)
-                
-                if not has_experimental:
-                    unjustified.append(
-                        f"CAUSAL CLAIM WITHOUT EXPERIMENTAL EVIDENCE: {claim}"
-                    )
-        
-        return unjustified
     
     def format_uncertainty(
         self,
@@ -330,6 +374,26 @@ class EvidenceModule(BaseModule):
         Returns:
             Formatted string with uncertainty
         """
-        if language == "ar":
-            return f"{value:.2f} ± {uncertainty:.2f} {units}"
+        # Numerals and the ± sign render identically in both languages
         return f"{value:.2f} ± {uncertainty:.2f} {units}"
+    
+    def format_uncertainty_batch(
+        self,
+        values: np.ndarray,
+        uncertainties: np.ndarray,
+        units: str = "",
+    ) -> np.ndarray:
+        """
+        Format arrays of values with uncertainty in one vectorized pass.
+        
+        Args:
+            values: Central values
+            uncertainties: Uncertainties (±), same shape as values
+            units: Units of measurement
+            
+        Returns:
+            Array of formatted strings, matching format_uncertainty
+        """
+        formatted = np.char.add(np.char.mod("%.2f", values), " ± ")
+        formatted = np.char.add(formatted, np.char.mod("%.2f", uncertainties))
+        return np.char.add(formatted, f" {units}")
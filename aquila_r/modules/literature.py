@@ -8,10 +8,14 @@ Responsible for:
 - Identifying gaps, contradictions, and under-researched areas
 """
 
-from typing import Dict, List, Optional, Any
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from hashlib import sha256
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
-from datetime import datetime
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
 
 from aquila_r.modules.base import (
     BaseModule,
@@ -45,7 +49,14 @@ class SourceQuality(str, Enum):
 
 
 class SourceEvaluation(BaseModel):
-    """Evaluation of a single source."""
+    """
+    Evaluation of a single source.
+    
+    Frozen: evaluations are cached and shared between callers and
+    result indexes, so their fields must not be reassigned.
+    """
+    
+    model_config = ConfigDict(frozen=True)
     
     source_id: str
     title: str
@@ -67,22 +78,24 @@ class SourceEvaluation(BaseModel):
     abstract: Optional[str] = None
 
 
-class LiteratureGap(BaseModel):
+@dataclass(slots=True)
+class LiteratureGap:
     """An identified gap in the literature."""
     
     description: str
-    significance: str = Field(default="medium")  # low, medium, high
-    language_context: str = Field(default="both")  # en, ar, both
-    research_questions: List[str] = Field(default_factory=list)
+    significance: str = "medium"  # low, medium, high
+    language_context: str = "both"  # en, ar, both
+    research_questions: List[str] = field(default_factory=list)
 
 
-class LiteratureContradiction(BaseModel):
+@dataclass(slots=True)
+class LiteratureContradiction:
     """A contradiction between sources."""
     
     description: str
     source_a: str
     source_b: str
-    nature: str = Field(default="methodological")  # methodological, empirical, theoretical
+    nature: str = "methodological"  # methodological, empirical, theoretical
     resolution_notes: Optional[str] = None
 
 
@@ -107,6 +120,78 @@ class LiteratureResult(ModuleResult):
         return [s for s in self.sources if s.source_type == source_type]
 
 
+def _source_id(title: str, authors: Sequence[str], year: Optional[int]) -> str:
+    """Derive the stable short identifier for a source."""
+    # Hash the list form so tuple and list authors give the same id
+    return sha256(f"{title}_{list(authors)}_{year}".encode()).hexdigest()[:16]
+
+
+class BulkSourceView:
+    """
+    Column-oriented evaluation of many sources.
+    
+    Holds the input metadata as parallel columns with inferred types
+    and quality scores as arrays. SourceEvaluation objects are only
+    built when an item is accessed.
+    """
+    
+    def __init__(
+        self,
+        columns: Dict[str, Sequence[Any]],
+        source_types: List[SourceType],
+        scores: np.ndarray,
+    ):
+        self._columns = columns
+        self.source_types = source_types
+        self.scores = scores
+    
+    def __len__(self) -> int:
+        """Number of sources in the batch."""
+        return len(self.source_types)
+    
+    def __getitem__(self, index: int) -> SourceEvaluation:
+        """Build the SourceEvaluation for one source."""
+        title, authors, year, abstract, language, url, doi = (
+            self._columns[name][index]
+            for name in ("titles", "authors", "years", "abstracts", "languages", "urls", "dois")
+        )
+        return SourceEvaluation(
+            source_id=_source_id(title, authors, year),
+            title=title,
+            authors=authors,
+            year=year,
+            source_type=self.source_types[index],
+            quality=self.quality(index),
+            language=language,
+            url=url,
+            doi=doi,
+            abstract=abstract,
+            verified=doi is not None,
+        )
+    
+    def quality(self, index: int) -> SourceQuality:
+        """Get the quality level of one source without materializing it."""
+        return LiteratureModule._QUALITY_BY_SCORE[self.scores[index]]
+    
+    def high_quality_indices(self) -> np.ndarray:
+        """Get indices of sources rated as high quality."""
+        return np.flatnonzero(self.scores >= _HIGH_QUALITY_SCORE)
+    
+    def get_high_quality_sources(self) -> List[SourceEvaluation]:
+        """Materialize only the sources rated as high quality."""
+        return [self[i] for i in self.high_quality_indices()]
+
+
+# Lowest score mapped to SourceQuality.HIGH
+_HIGH_QUALITY_SCORE = 5
+
+# Coverage flags reduced over sources in identify_gaps
+_HAS_EN = 1
+_HAS_AR = 2
+_HAS_PEER_REVIEWED = 4
+_FULL_COVERAGE = _HAS_EN | _HAS_AR | _HAS_PEER_REVIEWED
+
+
 class LiteratureModule(BaseModule):
     """
     Literature Intelligence Module.
@@ -119,10 +204,51 @@ class LiteratureModule(BaseModule):
     description = "Literature discovery, evaluation, and gap identification"
     supported_languages = ["en", "ar"]
     
+    # Source type indicators; group order is precedence order
+    _TITLE_TYPE_RE = re.compile(
+        r"(?P<thesis>thesis|dissertation)"
+        r"|(?P<report>report|working paper)"
+        r"|(?P<conference>conference|proceedings)",
+        re.IGNORECASE,
+    )
+    _URL_TYPE_RE = re.compile(r"(?P<preprint>arxiv)|(?P<news>news|bbc|cnn)", re.IGNORECASE)
+    # Quality score contributed by each source type
+    _TYPE_SCORES = {
+        SourceType.PEER_REVIEWED: 3,
+        SourceType.BOOK: 2,
+        SourceType.THESIS: 2,
+        SourceType.CONFERENCE: 2,
+        SourceType.REPORT: 1,
+        SourceType.GRAY_LITERATURE: 1,
+        SourceType.PREPRINT: 1,
+        SourceType.OPINION: 0,
+        SourceType.NEWS: 0,
+        SourceType.UNKNOWN: 0,
+    }
+    # Quality level for each attainable score (0-7)
+    _QUALITY_BY_SCORE = (
+        SourceQuality.UNCERTAIN,
+        SourceQuality.LOW,
+        SourceQuality.LOW,
+        SourceQuality.MEDIUM,
+        SourceQuality.MEDIUM,
+        SourceQuality.HIGH,
+        SourceQuality.HIGH,
+        SourceQuality.HIGH,
+    )
+    _LANGUAGE_BITS = {"en": _HAS_EN, "ar": _HAS_AR}
+    _TYPE_BY_GROUP = {
+        "thesis": SourceType.THESIS,
+        "report": SourceType.REPORT,
+        "conference": SourceType.CONFERENCE,
+        "preprint": SourceType.PREPRINT,
+        "news": SourceType.NEWS,
+    }
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.retrieval_tools = []
-        self._source_cache: Dict[str, SourceEvaluation] = {}
+        self._source_cache: Dict[Tuple[Any, ...], SourceEvaluation] = {}
     
     def execute(self, context: ModuleContext) -> LiteratureResult:
         """
@@ -200,11 +326,15 @@ class LiteratureModule(BaseModule):
         Returns:
             SourceEvaluation with quality assessment
         """
-        import hashlib
+        key = (
+            title, tuple(authors), year, abstract,
+            source_type, language, url, doi,
+        )
+        cached = self._source_cache.get(key)
+        if cached is not None:
+            return cached
         
-        source_id = hashlib.sha256(
-            f"{title}_{authors}_{year}".encode()
-        ).hexdigest()[:16]
+        source_id = _source_id(title, authors, year)
         
         # Infer source type if not provided
         if source_type is None:
@@ -233,10 +363,91 @@ class LiteratureModule(BaseModule):
         )
         
         # Cache evaluation
-        self._source_cache[source_id] = evaluation
+        self._source_cache[key] = evaluation
         
         return evaluation
     
+    def evaluate_sources_bulk(
+        self,
+        titles: Sequence[str],
+        authors: Sequence[List[str]],
+        years: Optional[Sequence[Optional[int]]] = None,
+        abstracts: Optional[Sequence[Optional[str]]] = None,
+        source_types: Optional[Sequence[Optional[SourceType]]] = None,
+        languages: Optional[Sequence[str]] = None,
+        urls: Optional[Sequence[Optional[str]]] = None,
+        dois: Optional[Sequence[Optional[str]]] = None,
+    ) -> BulkSourceView:
+        """
+        Evaluate many sources given as parallel columns.
+        
+        Quality scoring runs as array arithmetic over the whole batch,
+        and per-source models are only built when accessed.
+        
+        Args:
+            titles: Source titles
+            authors: Author lists, one per source
+            years: Publication years
+            abstracts: Source abstracts
+            source_types: Known source types (None entries are inferred)
+            languages: Source languages
+            urls: Source URLs
+            dois: DOIs where available
+            
+        Returns:
+            BulkSourceView over the evaluated sources
+            
+        Raises:
+            ValueError: If a given column's length differs from titles
+        """
+        n = len(titles)
+        given = {
+            "authors": authors, "years": years, "abstracts": abstracts,
+            "source_types": source_types, "languages": languages,
+            "urls": urls, "dois": dois,
+        }
+        for name, column in given.items():
+            if column is not None and len(column) != n:
+                raise ValueError(
+                    f"{name} has {len(column)} entries for {n} titles"
+                )
+        
+        missing = [None] * n
+        years = years if years is not None else missing
+        abstracts = abstracts if abstracts is not None else missing
+        urls = urls if urls is not None else missing
+        dois = dois if dois is not None else missing
+        
+        inferred = [
+            source_type if source_type is not None
+            else self._infer_source_type(title, abstract, url)
+            for source_type, title, abstract, url in zip(
+                source_types if source_types is not None else missing,
+                titles, abstracts, urls,
+                strict=True,
+            )
+        ]
+        
+        type_scores = self._TYPE_SCORES
+        scores = np.fromiter((type_scores.get(t, 0) for t in inferred), dtype=np.int64, count=n)
+        scores += 2 * np.fromiter((d is not None for d in dois), dtype=np.bool_, count=n)
+        scores += np.fromiter((a is not None for a in abstracts), dtype=np.bool_, count=n)
+        year_values = np.fromiter(
+            (y if y is not None else -1 for y in years), dtype=np.int64, count=n,
+        )
+        scores += year_values >= 2020
+        
+        columns = {
+            "titles": titles,
+            "authors": authors,
+            "years": years,
+            "abstracts": abstracts,
+            "languages": languages if languages is not None else ["en"] * n,
+            "urls": urls,
+            "dois": dois,
+        }
+        return BulkSourceView(columns, inferred, scores)
+    
     def _infer_source_type(
         self,
         title: str,
@@ -244,26 +455,29 @@ class LiteratureModule(BaseModule):
         url: Optional[str],
     ) -> SourceType:
         """Infer source type from available metadata."""
-        title_lower = title.lower()
-        
-        # Check for common indicators
-        if "thesis" in title_lower or "dissertation" in title_lower:
-            return SourceType.THESIS
-        
-        if "report" in title_lower or "working paper" in title_lower:
-            return SourceType.REPORT
-        
-        if "conference" in title_lower or "proceedings" in title_lower:
-            return SourceType.CONFERENCE
-        
-        if url:
-            url_lower = url.lower()
-            if "arxiv" in url_lower:
-                return SourceType.PREPRINT
-            if "news" in url_lower or "bbc" in url_lower or "cnn" in url_lower:
-                return SourceType.NEWS
-        
-        return SourceType.UNKNOWN
+        source_type = self._match_source_type(self._TITLE_TYPE_RE, title)
+        if source_type is None and url:
+            source_type = self._match_source_type(self._URL_TYPE_RE, url)
+        return source_type or SourceType.UNKNOWN
+    
+    def _match_source_type(
+        self,
+        pattern: "re.Pattern[str]",
+        text: str,
+    ) -> Optional[SourceType]:
+        """Return the highest-precedence type indicated in text, if any."""
+        best_index = 0
+        best_group: Optional[str] = None
+        for match in pattern.finditer(text):
+            # Each alternative is one named group, so every match sets both
+            index, group = match.lastindex, match.lastgroup
+            assert index is not None and group is not None
+            # Group index encodes precedence; 1 cannot be beaten
+            if best_group is None or index < best_index:
+                best_index, best_group = index, group
+                if index == 1:
+                    break
+        return self._TYPE_BY_GROUP[best_group] if best_group else None
     
     def _assess_quality(
         self,
@@ -273,43 +487,13 @@ class LiteratureModule(BaseModule):
         has_abstract: bool,
     ) -> SourceQuality:
         """Assess source quality based on indicators."""
-        score = 0
-        
-        # Source type scoring
-        type_scores = {
-            SourceType.PEER_REVIEWED: 3,
-            SourceType.BOOK: 2,
-            SourceType.THESIS: 2,
-            SourceType.CONFERENCE: 2,
-            SourceType.REPORT: 1,
-            SourceType.GRAY_LITERATURE: 1,
-            SourceType.PREPRINT: 1,
-            SourceType.OPINION: 0,
-            SourceType.NEWS: 0,
-            SourceType.UNKNOWN: 0,
-        }
-        score += type_scores.get(source_type, 0)
-        
-        # DOI indicates formal publication
-        if has_doi:
-            score += 2
-        
-        # Abstract indicates completeness
-        if has_abstract:
-            score += 1
-        
-        # Recency (for time-sensitive topics)
-        if year and year >= 2020:
-            score += 1
-        
-        # Convert to quality level
-        if score >= 5:
-            return SourceQuality.HIGH
-        elif score >= 3:
-            return SourceQuality.MEDIUM
-        elif score >= 1:
-            return SourceQuality.LOW
-        return SourceQuality.UNCERTAIN
+        score = (
+            self._TYPE_SCORES.get(source_type, 0)
+            + 2 * has_doi  # DOI indicates formal publication
+            + has_abstract  # Abstract indicates completeness
+            + (year is not None and year >= 2020)  # Recency
+        )
+        return self._QUALITY_BY_SCORE[score]
     
     def identify_gaps(
         self,
@@ -328,11 +512,19 @@ class LiteratureModule(BaseModule):
         """
         gaps = []
         
-        # Check language coverage
-        en_sources = [s for s in sources if s.language == "en"]
-        ar_sources = [s for s in sources if s.language == "ar"]
+        # Reduce coverage to flag bits; stop once every flag is set
+        coverage = 0
+        for source in sources:
+            coverage |= self._LANGUAGE_BITS.get(source.language, 0)
+            if source.source_type == SourceType.PEER_REVIEWED:
+                coverage |= _HAS_PEER_REVIEWED
+            if coverage == _FULL_COVERAGE:
+                break
+        has_en = bool(coverage & _HAS_EN)
+        has_ar = bool(coverage & _HAS_AR)
         
-        if not ar_sources and en_sources:
+        # Check language coverage
+        if not has_ar and has_en:
             gaps.append(LiteratureGap(
                 description="No Arabic-language sources identified. "
                            "Arabic scholarly perspectives may be underrepresented.",
@@ -344,7 +536,7 @@ class LiteratureModule(BaseModule):
                 ],
             ))
         
-        if not en_sources and ar_sources:
+        if not has_en and has_ar:
             gaps.append(LiteratureGap(
                 description="No English-language sources identified. "
                            "International perspectives may be underrepresented.",
@@ -353,8 +545,7 @@ class LiteratureModule(BaseModule):
             ))
         
         # Check source type diversity
-        types_present = {s.source_type for s in sources}
-        if SourceType.PEER_REVIEWED not in types_present:
+        if not coverage & _HAS_PEER_REVIEWED:
             gaps.append(LiteratureGap(
                 description="No peer-reviewed sources identified. "
                            "Findings require validation from peer-reviewed literature.",
@@ -386,8 +577,9 @@ class LiteratureModule(BaseModule):
         # Placeholder for actual tradition comparison
         # This would require content analysis through LLM
         
-        en_count = len([s for s in sources if s.language == "en"])
-        ar_count = len([s for s in sources if s.language == "ar"])
+        lang_counts = Counter(s.language for s in sources)
+        en_count = lang_counts["en"]
+        ar_count = lang_counts["ar"]
         
         traditions["comparative_notes"].append(
             f"Source distribution: {en_count} English, {ar_count} Arabic"
@@ -8,10 +8,15 @@ Responsible for:
 - Preserving disagreements rather than flattening them
 """
 
-from typing import Dict, List, Optional, Any, Set
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Dict, List, Optional, Any, Sequence, Set, Tuple
 from enum import Enum
+import numpy as np
 from pydantic import BaseModel, Field
 
+from aquila_r._terms import found_terms
 from aquila_r.modules.base import (
     BaseModule,
     ModuleContext,
@@ -21,16 +26,17 @@ from aquila_r.modules.base import (
 )
 
 
-class TheoreticalPosition(BaseModel):
+@dataclass(slots=True)
+class TheoreticalPosition:
     """A theoretical position or school of thought."""
     
     name: str
     description: str
-    key_proponents: List[str] = Field(default_factory=list)
-    key_claims: List[str] = Field(default_factory=list)
-    evidence_types: List[str] = Field(default_factory=list)
-    critiques: List[str] = Field(default_factory=list)
-    language_tradition: str = Field(default="both")  # en, ar, both
+    key_proponents: List[str] = field(default_factory=list)
+    key_claims: List[str] = field(default_factory=list)
+    evidence_types: List[str] = field(default_factory=list)
+    critiques: List[str] = field(default_factory=list)
+    language_tradition: str = "both"  # en, ar, both
 
 
 class ScholarlyDebate(BaseModel):
@@ -47,27 +53,29 @@ class ScholarlyDebate(BaseModel):
         return len(self.positions) > 1 and len(self.unresolved_questions) > 0
 
 
-class ConceptualFramework(BaseModel):
+@dataclass(slots=True)
+class ConceptualFramework:
     """A conceptual or theoretical framework."""
     
     name: str
     description: str
-    core_concepts: List[str] = Field(default_factory=list)
-    relationships: List[str] = Field(default_factory=list)
-    assumptions: List[str] = Field(default_factory=list)
-    applicability: str = Field(default="")
-    limitations: List[str] = Field(default_factory=list)
+    core_concepts: List[str] = field(default_factory=list)
+    relationships: List[str] = field(default_factory=list)
+    assumptions: List[str] = field(default_factory=list)
+    applicability: str = ""
+    limitations: List[str] = field(default_factory=list)
 
 
-class LiteratureTheme(BaseModel):
+@dataclass(slots=True)
+class LiteratureTheme:
     """A theme identified in the literature."""
     
     name: str
     description: str
-    source_count: int = Field(default=0)
-    languages: List[str] = Field(default_factory=list)
-    sub_themes: List[str] = Field(default_factory=list)
-    key_findings: List[str] = Field(default_factory=list)
+    source_count: int = 0
+    languages: List[str] = field(default_factory=list)
+    sub_themes: List[str] = field(default_factory=list)
+    key_findings: List[str] = field(default_factory=list)
 
 
 class SynthesisResult(ModuleResult):
@@ -82,10 +90,13 @@ class SynthesisResult(ModuleResult):
     
     def get_unresolved_questions(self) -> List[str]:
         """Get all unresolved questions across debates."""
-        questions = []
-        for debate in self.debates:
-            questions.extend(debate.unresolved_questions)
-        return questions
+        return list(chain.from_iterable(
+            debate.unresolved_questions for debate in self.debates
+        ))
+
+
+# Sentinel for absent metadata keys
+_MISSING = object()
 
 
 class SynthesisModule(BaseModule):
@@ -100,9 +111,13 @@ class SynthesisModule(BaseModule):
     description = "Literature synthesis, framework building, and debate mapping"
     supported_languages = ["en", "ar"]
     
+    # Most recent literature review outlines kept per module instance
+    _OUTLINE_CACHE_SIZE = 32
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self._themes_cache: Dict[str, LiteratureTheme] = {}
+        self._outline_cache: OrderedDict[Tuple[Any, ...], str] = OrderedDict()
     
     def execute(self, context: ModuleContext) -> SynthesisResult:
         """
@@ -164,10 +179,14 @@ class SynthesisModule(BaseModule):
             ConceptualFramework object
         """
         # Extract assumptions from findings
-        assumptions = []
-        for finding in source_findings:
-            if "assumption" in finding.metadata:
-                assumptions.append(finding.metadata["assumption"])
+        assumptions = [
+            value
+            for value in (
+                finding.metadata_view.get("assumption", _MISSING)
+                for finding in source_findings
+            )
+            if value is not _MISSING
+        ]
         
         # Build framework
         framework = ConceptualFramework(
@@ -224,6 +243,7 @@ class SynthesisModule(BaseModule):
         self,
         findings: List[Finding],
         min_occurrence: int = 2,
+        keywords: Optional[List[str]] = None,
     ) -> List[LiteratureTheme]:
         """
         Identify themes from research findings.
@@ -231,12 +251,15 @@ class SynthesisModule(BaseModule):
         Args:
             findings: List of research findings
             min_occurrence: Minimum occurrences to count as theme
+            keywords: Candidate theme keywords to match in findings
             
         Returns:
             List of identified themes
         """
         # Simple keyword-based theme identification
         # Full implementation would use NLP/LLM
+        if keywords:
+            return self._identify_keyword_themes(findings, keywords, min_occurrence)
         
         themes: List[LiteratureTheme] = []
         
@@ -257,6 +280,37 @@ class SynthesisModule(BaseModule):
         
         return themes
     
+    def _identify_keyword_themes(
+        self,
+        findings: List[Finding],
+        keywords: List[str],
+        min_occurrence: int,
+    ) -> List[LiteratureTheme]:
+        """Count findings per keyword with a single scan of each finding."""
+        # Case-insensitive substring match, as keyword.casefold() in content
+        folded = {keyword: keyword.casefold() for keyword in keywords}
+        terms = tuple(folded.values())
+        counts: Dict[str, int] = {}
+        languages: Dict[str, Set[str]] = {}
+        
+        for finding in findings:
+            found = found_terms(terms, finding.content.casefold())
+            for keyword, key in folded.items():
+                if key in found:
+                    counts[keyword] = counts.get(keyword, 0) + 1
+                    languages.setdefault(keyword, set()).add(finding.language)
+        
+        return [
+            LiteratureTheme(
+                name=keyword,
+                description=f"Findings referring to '{keyword}'",
+                source_count=counts[keyword],
+                languages=sorted(languages[keyword]),
+            )
+            for keyword in keywords
+            if counts.get(keyword, 0) >= min_occurrence
+        ]
+    
     def synthesize_findings(
         self,
         findings: List[Finding],
@@ -274,23 +328,72 @@ class SynthesisModule(BaseModule):
         """
         consensus: List[str] = []
         contested: List[str] = []
+        low_confidence: List[str] = []
         
         # Group findings by topic/theme (simplified)
         # Full implementation would use semantic similarity
         
-        high_confidence = [f for f in findings if f.confidence >= 0.8]
-        medium_confidence = [f for f in findings if 0.5 <= f.confidence < 0.8]
-        low_confidence = [f for f in findings if f.confidence < 0.5]
-        
-        # High confidence with multiple sources -> consensus
-        for finding in high_confidence:
-            consensus.append(finding.content)
+        for finding in findings:
+            confidence = finding.confidence
+            if confidence >= 0.8:
+                # High confidence with multiple sources -> consensus
+                consensus.append(finding.content)
+            elif preserve_disagreements:
+                # Lower confidence or single source -> contested,
+                # medium-confidence findings listed first
+                entry = f"[Confidence: {confidence:.0%}] {finding.content}"
+                (contested if confidence >= 0.5 else low_confidence).append(entry)
+        
+        contested.extend(low_confidence)
+        return consensus, contested
+    
+    def synthesize_findings_batch(
+        self,
+        contents: Sequence[str],
+        confidences: np.ndarray,
+        preserve_disagreements: bool = True,
+    ) -> tuple[List[str], List[str]]:
+        """
+        Synthesize findings given as parallel columns.
         
-        # Lower confidence or single source -> contested
-        if preserve_disagreements:
-            for finding in medium_confidence + low_confidence:
-                contested.append(f"[Confidence: {finding.confidence:.0%}] {finding.content}")
+        Bucketing runs as array comparisons over the whole batch; the
+        output matches synthesize_findings for the same findings.
         
+        Args:
+            contents: Finding contents
+            confidences: Confidence scores, one per content
+            preserve_disagreements: Whether to keep disagreements explicit
+            
+        Returns:
+            Tuple of (consensus_findings, contested_findings)
+            
+        Raises:
+            ValueError: If the columns differ in length or a confidence
+                is outside 0-1, as Finding would reject it
+        """
+        confidences = np.asarray(confidences, dtype=np.float64)
+        if confidences.shape != (len(contents),):
+            raise ValueError(
+                f"{confidences.size} confidences for {len(contents)} contents"
+            )
+        in_range = (confidences >= 0.0) & (confidences <= 1.0)
+        if not in_range.all():
+            bad = confidences[np.argmin(in_range)]
+            raise ValueError(f"confidence must be between 0 and 1, got {bad}")
+        
+        consensus = [contents[i] for i in np.flatnonzero(confidences >= 0.8).tolist()]
+        if not preserve_disagreements:
+            return consensus, []
+        
+        # Medium-confidence findings first, then low, each in input order
+        medium = np.flatnonzero((confidences >= 0.5) & (confidences < 0.8))
+        low = np.flatnonzero(confidences < 0.5)
+        order = np.concatenate((medium, low))
+        percents = np.char.mod("%.0f", confidences[order] * 100)
+        contested = [
+            f"[Confidence: {percent}%] {contents[i]}"
+            for i, percent in zip(order.tolist(), percents.tolist(), strict=True)
+        ]
         return consensus, contested
     
     def generate_literature_review_structure(
@@ -310,9 +413,37 @@ class SynthesisModule(BaseModule):
         Returns:
             Structured outline as markdown
         """
+        # Key on every field the outlines render, so edits invalidate it
+        key = (
+            language,
+            tuple(
+                (t.name, t.source_count, tuple(t.languages), tuple(t.sub_themes))
+                for t in themes
+            ),
+            tuple(
+                (
+                    d.topic,
+                    d.is_contested(),
+                    tuple((p.name, p.description) for p in d.positions),
+                )
+                for d in debates
+            ),
+        )
+        cached = self._outline_cache.get(key)
+        if cached is not None:
+            self._outline_cache.move_to_end(key)
+            return cached
+        
         if language == "ar":
-            return self._generate_arabic_outline(themes, debates)
-        return self._generate_english_outline(themes, debates)
+            outline = self._generate_arabic_outline(themes, debates)
+        else:
+            outline = self._generate_english_outline(themes, debates)
+        
+        self._outline_cache[key] = outline
+        if len(self._outline_cache) > self._OUTLINE_CACHE_SIZE:
+            # Evict the least recently used outline
+            self._outline_cache.popitem(last=False)
+        return outline
     
     def _generate_english_outline(
         self,
@@ -320,43 +451,45 @@ class SynthesisModule(BaseModule):
         debates: List[ScholarlyDebate],
     ) -> str:
         """Generate English outline."""
-        lines = ["# Literature Review Structure\n"]
-        
-        lines.append("\n## 1. Introduction\n")
-        lines.append("- Research context and significance\n")
-        lines.append("- Scope and boundaries\n")
-        lines.append("- Review methodology\n")
-        
-        lines.append("\n## 2. Thematic Analysis\n")
-        for i, theme in enumerate(themes, 1):
-            lines.append(f"\n### 2.{i}. {theme.name}\n")
-            lines.append(f"- Sources: {theme.source_count}\n")
-            lines.append(f"- Languages: {', '.join(theme.languages)}\n")
-            if theme.sub_themes:
-                lines.append("- Sub-themes:\n")
-                for st in theme.sub_themes:
-                    lines.append(f"  - {st}\n")
-        
-        lines.append("\n## 3. Scholarly Debates\n")
-        for i, debate in enumerate(debates, 1):
-            lines.append(f"\n### 3.{i}. {debate.topic}\n")
-            if debate.is_contested():
-                lines.append("*Status: Contested*\n")
-            for pos in debate.positions:
-                lines.append(f"\n#### Position: {pos.name}\n")
-                lines.append(f"{pos.description}\n")
-        
-        lines.append("\n## 4. Synthesis and Gaps\n")
-        lines.append("- Consensus findings\n")
-        lines.append("- Contested areas\n")
-        lines.append("- Research gaps\n")
-        
-        lines.append("\n## 5. Conclusion\n")
-        lines.append("- Key insights\n")
-        lines.append("- Limitations of review\n")
-        lines.append("- Future research directions\n")
-        
-        return "".join(lines)
+        theme_blocks = "".join(
+            f"\n### 2.{i}. {theme.name}\n"
+            f"- Sources: {theme.source_count}\n"
+            f"- Languages: {', '.join(theme.languages)}\n"
+            + (
+                "- Sub-themes:\n" + "".join(f"  - {st}\n" for st in theme.sub_themes)
+                if theme.sub_themes else ""
+            )
+            for i, theme in enumerate(themes, 1)
+        )
+        debate_blocks = "".join(
+            f"\n### 3.{i}. {debate.topic}\n"
+            + ("*Status: Contested*\n" if debate.is_contested() else "")
+            + "".join(
+                f"\n#### Position: {pos.name}\n{pos.description}\n"
+                for pos in debate.positions
+            )
+            for i, debate in enumerate(debates, 1)
+        )
+        
+        return (
+            "# Literature Review Structure\n"
+            "\n## 1. Introduction\n"
+            "- Research context and significance\n"
+            "- Scope and boundaries\n"
+            "- Review methodology\n"
+            "\n## 2. Thematic Analysis\n"
+            f"{theme_blocks}"
+            "\n## 3. Scholarly Debates\n"
+            f"{debate_blocks}"
+            "\n## 4. Synthesis and Gaps\n"
+            "- Consensus findings\n"
+            "- Contested areas\n"
+            "- Research gaps\n"
+            "\n## 5. Conclusion\n"
+            "- Key insights\n"
+            "- Limitations of review\n"
+            "- Future research directions\n"
+        )
     
     def _generate_arabic_outline(
         self,
@@ -364,31 +497,33 @@ class SynthesisModule(BaseModule):
         debates: List[ScholarlyDebate],
     ) -> str:
         """Generate Arabic outline."""
-        lines = ["# هيكل مراجعة الأدبيات\n"]
-        
-        lines.append("\n## 1. المقدمة\n")
-        lines.append("- سياق البحث وأهميته\n")
-        lines.append("- النطاق والحدود\n")
-        lines.append("- منهجية المراجعة\n")
-        
-        lines.append("\n## 2. التحليل الموضوعي\n")
-        for i, theme in enumerate(themes, 1):
-            lines.append(f"\n### 2.{i}. {theme.name}\n")
-            lines.append(f"- المصادر: {theme.source_count}\n")
-            lines.append(f"- اللغات: {', '.join(theme.languages)}\n")
-        
-        lines.append("\n## 3. النقاشات العلمية\n")
-        for i, debate in enumerate(debates, 1):
-            lines.append(f"\n### 3.{i}. {debate.topic}\n")
-        
-        lines.append("\n## 4. التوليف والفجوات\n")
-        lines.append("- النتائج المتفق عليها\n")
-        lines.append("- المناطق المتنازع عليها\n")
-        lines.append("- فجوات البحث\n")
-        
-        lines.append("\n## 5. الخاتمة\n")
-        lines.append("- الرؤى الرئيسية\n")
-        lines.append("- قيود المراجعة\n")
-        lines.append("- اتجاهات البحث المستقبلية\n")
-        
-        return "".join(lines)
+        theme_blocks = "".join(
+            f"\n### 2.{i}. {theme.name}\n"
+            f"- المصادر: {theme.source_count}\n"
+            f"- اللغات: {', '.join(theme.languages)}\n"
+            for i, theme in enumerate(themes, 1)
+        )
+        debate_blocks = "".join(
+            f"\n### 3.{i}. {debate.topic}\n"
+            for i, debate in enumerate(debates, 1)
+        )
+        
+        return (
+            "# هيكل مراجعة الأدبيات\n"
+            "\n## 1. المقدمة\n"
+            "- سياق البحث وأهميته\n"
+            "- النطاق والحدود\n"
+            "- منهجية المراجعة\n"
+            "\n## 2. التحليل الموضوعي\n"
+            f"{theme_blocks}"
+            "\n## 3. النقاشات العلمية\n"
+            f"{debate_blocks}"
+            "\n## 4. التوليف والفجوات\n"
+            "- النتائج المتفق عليها\n"
+            "- المناطق المتنازع عليها\n"
+            "- فجوات البحث\n"
+            "\n## 5. الخاتمة\n"
+            "- الرؤى الرئيسية\n"
+            "- قيود المراجعة\n"
+            "- اتجاهات البحث المستقبلية\n"
+        )
@@ -7,9 +7,10 @@ Responsible for:
 - Never inventing citations
 """
 
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 from aquila_r.modules.base import (
@@ -34,6 +35,8 @@ class DocumentType(str, Enum):
 class DraftSection(BaseModel):
     """A section of a document draft."""
     
+    model_config = ConfigDict(frozen=True)
+    
     heading: str
     content: str
     citations_used: List[str] = Field(default_factory=list)
@@ -45,10 +48,12 @@ class DraftSection(BaseModel):
 class DocumentTemplate(BaseModel):
     """Template for a document type."""
     
+    model_config = ConfigDict(frozen=True)
+    
     document_type: DocumentType
-    sections: List[str]
-    required_elements: List[str]
-    optional_elements: List[str]
+    sections: Tuple[str, ...]
+    required_elements: Tuple[str, ...]
+    optional_elements: Tuple[str, ...]
     max_length_words: Optional[int] = None
     language: str = Field(default="en")
 
@@ -64,10 +69,142 @@ class WritingResult(ModuleResult):
     
     def get_full_draft(self) -> str:
         """Combine all sections into full draft."""
-        parts = []
-        for section in self.draft_sections:
-            parts.append(f"## {section.heading}\n\n{section.content}\n")
-        return "\n".join(parts)
+        return "\n".join(
+            f"## {section.heading}\n\n{section.content}\n"
+            for section in self.draft_sections
+        )
+
+
+_PLACEHOLDER_EN = (
+    "[{section_type} Content]\n\n"
+    "This section requires specific content from the user.\n"
+    "Please add:\n"
+    "- Your specific research findings\n"
+    "- Domain expertise and interpretation\n"
+    "- Verified citations from your sources\n"
+)
+_PLACEHOLDER_AR = (
+    "[محتوى قسم {section_type}]\n\n"
+    "يتطلب هذا القسم محتوى محدداً من المستخدم.\n"
+    "يرجى إضافة:\n"
+    "- نتائج بحثك المحددة\n"
+    "- خبرتك في المجال\n"
+    "- الاستشهادات الموثقة\n"
+)
+
+
+# Abstract labels per language:
+# (background, methods, results, findings separator, conclusions)
+_ABSTRACT_LABELS: Dict[str, Tuple[str, str, str, str, str]] = {
+    "en": (
+        "**Background:** This study addresses: ",
+        "**Methods:** ",
+        "**Results:** ",
+        "; ",
+        "**Conclusions:** [User to add conclusions based on findings]\n",
+    ),
+    "ar": (
+        "**الخلفية:** تتناول هذه الدراسة: ",
+        "**المنهجية:** ",
+        "**النتائج:** ",
+        "؛ ",
+        "**الخلاصة:** [يضيف المستخدم الاستنتاجات بناءً على النتائج]\n",
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_templates() -> Dict[Tuple[DocumentType, str], DocumentTemplate]:
+    """
+    Build the built-in document templates.
+    
+    Built once per process, one frozen instance per document type and
+    supported language, so get_template can hand them out directly.
+    """
+    templates = {
+        DocumentType.RESEARCH_PROPOSAL: DocumentTemplate(
+            document_type=DocumentType.RESEARCH_PROPOSAL,
+            sections=(
+                "Title and Abstract",
+                "Introduction and Problem Statement",
+                "Literature Review",
+                "Research Questions/Hypotheses",
+                "Methodology",
+                "Expected Contributions",
+                "Timeline",
+                "References",
+            ),
+            required_elements=(
+                "Clear research question",
+                "Methodological approach",
+                "Significance statement",
+            ),
+            optional_elements=(
+                "Preliminary findings",
+                "Budget",
+            ),
+        ),
+        DocumentType.ABSTRACT: DocumentTemplate(
+            document_type=DocumentType.ABSTRACT,
+            sections=(
+                "Background",
+                "Methods",
+                "Results",
+                "Conclusions",
+            ),
+            required_elements=(
+                "Research objective",
+                "Key findings",
+            ),
+            optional_elements=(
+                "Implications",
+            ),
+            max_length_words=300,
+        ),
+        DocumentType.LITERATURE_REVIEW: DocumentTemplate(
+            document_type=DocumentType.LITERATURE_REVIEW,
+            sections=(
+                "Introduction",
+                "Search Strategy",
+                "Thematic Analysis",
+                "Critical Evaluation",
+                "Synthesis",
+                "Gaps and Future Directions",
+            ),
+            required_elements=(
+                "Scope definition",
+                "Source evaluation criteria",
+                "Synthesis of findings",
+            ),
+            optional_elements=(
+                "Theoretical framework",
+            ),
+        ),
+        DocumentType.POLICY_BRIEF: DocumentTemplate(
+            document_type=DocumentType.POLICY_BRIEF,
+            sections=(
+                "Executive Summary",
+                "Problem Statement",
+                "Evidence Review",
+                "Policy Options",
+                "Recommendations",
+            ),
+            required_elements=(
+                "Clear problem definition",
+                "Evidence-based recommendations",
+            ),
+            optional_elements=(
+                "Cost-benefit analysis",
+                "Implementation timeline",
+            ),
+            max_length_words=2000,
+        ),
+    }
+    return {
+        (document_type, language): template.model_copy(update={"language": language})
+        for document_type, template in templates.items()
+        for language in ("en", "ar")
+    }
 
 
 class WritingModule(BaseModule):
@@ -84,89 +221,7 @@ class WritingModule(BaseModule):
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
-        self._templates = self._load_templates()
-    
-    def _load_templates(self) -> Dict[DocumentType, DocumentTemplate]:
-        """Load document templates."""
-        return {
-            DocumentType.RESEARCH_PROPOSAL: DocumentTemplate(
-                document_type=DocumentType.RESEARCH_PROPOSAL,
-                sections=[
-                    "Title and Abstract",
-                    "Introduction and Problem Statement",
-                    "Literature Review",
-                    "Research Questions/Hypotheses",
-                    "Methodology",
-                    "Expected Contributions",
-                    "Timeline",
-                    "References",
-                ],
-                required_elements=[
-                    "Clear research question",
-                    "Methodological approach",
-                    "Significance statement",
-                ],
-                optional_elements=[
-                    "Preliminary findings",
-                    "Budget",
-                ],
-            ),
-            DocumentType.ABSTRACT: DocumentTemplate(
-                document_type=DocumentType.ABSTRACT,
-                sections=[
-                    "Background",
-                    "Methods",
-                    "Results",
-                    "Conclusions",
-                ],
-                required_elements=[
-                    "Research objective",
-                    "Key findings",
-                ],
-                optional_elements=[
-                    "Implications",
-                ],
-                max_length_words=300,
-            ),
-            DocumentType.LITERATURE_REVIEW: DocumentTemplate(
-                document_type=DocumentType.LITERATURE_REVIEW,
-                sections=[
-                    "Introduction",
-                    "Search Strategy",
-                    "Thematic Analysis",
-                    "Critical Evaluation",
-                    "Synthesis",
-                    "Gaps and Future Directions",
-                ],
-                required_elements=[
-                    "Scope definition",
-                    "Source evaluation criteria",
-                    "Synthesis of findings",
-                ],
-                optional_elements=[
-                    "Theoretical framework",
-                ],
-            ),
-            DocumentType.POLICY_BRIEF: DocumentTemplate(
-                document_type=DocumentType.POLICY_BRIEF,
-                sections=[
-                    "Executive Summary",
-                    "Problem Statement",
-                    "Evidence Review",
-                    "Policy Options",
-                    "Recommendations",
-                ],
-                required_elements=[
-                    "Clear problem definition",
-                    "Evidence-based recommendations",
-                ],
-                optional_elements=[
-                    "Cost-benefit analysis",
-                    "Implementation timeline",
-                ],
-                max_length_words=2000,
-            ),
-        }
+        self._templates = _build_templates()
     
     def execute(self, context: ModuleContext) -> WritingResult:
         """
@@ -227,17 +282,20 @@ class WritingModule(BaseModule):
         Returns:
             DocumentTemplate with structure
         """
-        template = self._templates.get(document_type)
-        if template:
-            template.language = language
+        template = self._templates.get((document_type, language))
+        if template is not None:
             return template
         
+        template = self._templates.get((document_type, "en"))
+        if template is not None:
+            return template.model_copy(update={"language": language})
+        
         # Return generic template if specific not found
         return DocumentTemplate(
             document_type=document_type,
-            sections=["Introduction", "Main Content", "Conclusion"],
-            required_elements=["Clear objective"],
-            optional_elements=[],
+            sections=("Introduction", "Main Content", "Conclusion"),
+            required_elements=("Clear objective",),
+            optional_elements=(),
             language=language,
         )
     
@@ -279,24 +337,8 @@ class WritingModule(BaseModule):
     
     def _get_placeholder_content(self, section_type: str, language: str) -> str:
         """Get placeholder content for a section."""
-        if language == "ar":
-            return (
-                f"[محتوى قسم {section_type}]\n\n"
-                "يتطلب هذا القسم محتوى محدداً من المستخدم.\n"
-                "يرجى إضافة:\n"
-                "- نتائج بحثك المحددة\n"
-                "- خبرتك في المجال\n"
-                "- الاستشهادات الموثقة\n"
-            )
-        
-        return (
-            f"[{section_type} Content]\n\n"
-            "This section requires specific content from the user.\n"
-            "Please add:\n"
-            "- Your specific research findings\n"
-            "- Domain expertise and interpretation\n"
-            "- Verified citations from your sources\n"
-        )
+        template = _PLACEHOLDER_AR if language == "ar" else _PLACEHOLDER_EN
+        return template.format(section_type=section_type)
     
     def validate_citations(
         self,
@@ -313,11 +355,12 @@ class WritingModule(BaseModule):
         Returns:
             Tuple of (valid_citations, invalid_citations)
         """
+        verified = frozenset(verified_sources)
         valid = []
         invalid = []
         
         for citation in citations:
-            if citation in verified_sources:
+            if citation in verified:
                 valid.append(citation)
             else:
                 invalid.append(citation)
@@ -343,14 +386,9 @@ class WritingModule(BaseModule):
         Returns:
             DraftSection with abstract structure
         """
-        if language == "ar":
-            content = self._build_arabic_abstract(
-                research_question, methodology, key_findings
-            )
-        else:
-            content = self._build_english_abstract(
-                research_question, methodology, key_findings
-            )
+        content = self._build_abstract(
+            research_question, methodology, key_findings, language
+        )
         
         return DraftSection(
             heading="Abstract" if language == "en" else "الملخص",
@@ -366,32 +404,23 @@ class WritingModule(BaseModule):
             confidence=0.5,
         )
     
-    def _build_english_abstract(
-        self,
-        research_question: str,
-        methodology: str,
-        key_findings: List[str],
-    ) -> str:
-        """Build English abstract."""
-        parts = [
-            f"**Background:** This study addresses: {research_question}\n",
-            f"**Methods:** {methodology}\n",
-            "**Results:** " + "; ".join(key_findings) + "\n" if key_findings else "",
-            "**Conclusions:** [User to add conclusions based on findings]\n",
-        ]
-        return "\n".join(parts)
-    
-    def _build_arabic_abstract(
+    def _build_abstract(
         self,
         research_question: str,
         methodology: str,
         key_findings: List[str],
+        language: str,
     ) -> str:
-        """Build Arabic abstract."""
-        parts = [
-            f"**الخلفية:** تتناول هذه الدراسة: {research_question}\n",
-            f"**المنهجية:** {methodology}\n",
-            "**النتائج:** " + "؛ ".join(key_findings) + "\n" if key_findings else "",
-            "**الخلاصة:** [يضيف المستخدم الاستنتاجات بناءً على النتائج]\n",
-        ]
-        return "\n".join(parts)
+        """Build abstract from the language's label table."""
+        background, methods, results, separator, conclusions = (
+            _ABSTRACT_LABELS["ar"] if language == "ar" else _ABSTRACT_LABELS["en"]
+        )
+        results_line = (
+            f"{results}{separator.join(key_findings)}\n" if key_findings else ""
+        )
+        return (
+            f"{background}{research_question}\n\n"
+            f"{methods}{methodology}\n\n"
+            f"{results_line}\n"
+            f"{conclusions}"
+        )
@@ -5,7 +5,7 @@ Ensures all outputs follow academic standards and
 structured formats.
 """
 
-from aquila_r.output.standards import OutputStandards, OutputSection
+from aquila_r.output.standards import OutputStandards, OutputSection, STANDARDS
 from aquila_r.output.formatters import (
     OutputFormatter,
     MarkdownFormatter,
@@ -15,6 +15,7 @@ from aquila_r.output.formatters import (
 __all__ = [
     "OutputStandards",
     "OutputSection",
+    "STANDARDS",
     "OutputFormatter",
     "MarkdownFormatter",
     "format_research_output",
@@ -5,11 +5,37 @@ Formats research outputs in various formats with
 language-specific handling.
 """
 
+import functools
+import io
 from typing import Dict, List, Optional, Any
 from abc import ABC, abstractmethod
 from datetime import datetime
 
-from aquila_r.output.standards import OutputStandards, OutputSection
+from aquila_r.output.standards import STANDARDS, OutputSection
+
+
+# Top-of-document heading per language; unknown languages fall back to English
+_HEADINGS: Dict[str, str] = {
+    "en": "Research Analysis",
+    "ar": "تحليل بحثي",
+}
+
+# Markdown title lines, precomputed from the headings
+_MARKDOWN_TITLES: Dict[str, str] = {
+    language: f"# {heading}\n" for language, heading in _HEADINGS.items()
+}
+
+# Confidence footer templates per language
+_CONFIDENCE_LINES: Dict[str, str] = {
+    "en": "\n---\n*Overall Confidence: {:.0%}*\n",
+    "ar": "\n---\n*درجة الثقة الإجمالية: {:.0%}*\n",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _format_timestamp(moment: datetime) -> str:
+    """Format a generation timestamp, cached for repeated renders."""
+    return moment.strftime("%Y-%m-%d %H:%M UTC")
 
 
 class OutputFormatter(ABC):
@@ -29,9 +55,10 @@ class OutputFormatter(ABC):
 class MarkdownFormatter(OutputFormatter):
     """Formats output as Markdown."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the formatter."""
-        self.standards = OutputStandards()
+        # Standards are read-only at render time, so all formatters share one
+        self.standards = STANDARDS
     
     def format(
         self,
@@ -50,30 +77,41 @@ class MarkdownFormatter(OutputFormatter):
         Returns:
             Formatted Markdown string
         """
-        lines = []
+        buf = io.StringIO()
+        self._write(buf, sections, metadata, language)
+        return buf.getvalue()
+    
+    def _write(
+        self,
+        buf: io.StringIO,
+        sections: Dict[OutputSection, str],
+        metadata: Optional[Dict[str, Any]],
+        language: str,
+    ) -> None:
+        """Write the formatted Markdown into buf."""
+        write = buf.write
         
         # Title
-        if language == "ar":
-            lines.append("# تحليل بحثي\n")
-        else:
-            lines.append("# Research Analysis\n")
+        write(_MARKDOWN_TITLES.get(language) or _MARKDOWN_TITLES["en"])
         
         # Metadata
         if metadata:
-            generated = metadata.get("generated_at", datetime.utcnow())
+            if "generated_at" in metadata:
+                generated = metadata["generated_at"]
+            else:
+                # Only minutes are rendered; truncating lets renders within
+                # the same minute share one formatted timestamp
+                generated = datetime.utcnow().replace(second=0, microsecond=0)
             if isinstance(generated, datetime):
-                generated = generated.strftime("%Y-%m-%d %H:%M UTC")
-            lines.append(f"*Generated: {generated}*\n\n")
+                generated = _format_timestamp(generated)
+            write(f"*Generated: {generated}*\n\n")
         
         # Sections
-        for section in self.standards.SECTION_ORDER:
-            content = sections.get(section)
+        sections_get = sections.get
+        for section, title in self.standards.get_ordered_titles(language):
+            content = sections_get(section)
             if content:
-                title = self.standards.get_section_title(section, language)
-                lines.append(f"\n## {title}\n\n")
-                lines.append(f"{content}\n")
-        
-        return "".join(lines)
+                write(f"\n## {title}\n\n{content}\n")
     
     def format_with_confidence(
         self,
@@ -82,22 +120,57 @@ class MarkdownFormatter(OutputFormatter):
         language: str = "en",
     ) -> str:
         """Format with confidence indicator."""
-        output = self.format(sections, language=language)
+        buf = io.StringIO()
+        self._write(buf, sections, None, language)
         
-        if language == "ar":
-            output += f"\n---\n*درجة الثقة الإجمالية: {confidence:.0%}*\n"
-        else:
-            output += f"\n---\n*Overall Confidence: {confidence:.0%}*\n"
+        line = _CONFIDENCE_LINES.get(language) or _CONFIDENCE_LINES["en"]
+        buf.write(line.format(confidence))
         
-        return output
+        return buf.getvalue()
+
+
+# Static document head shared by every HTML render
+_HTML_HEAD = (
+    '<head>\n'
+    '<meta charset="UTF-8">\n'
+    '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+    '<title>Research Analysis</title>\n'
+    '<style>\n'
+    'body { font-family: system-ui, sans-serif; max-width: 800px; margin: 0 auto; padding: 2rem; line-height: 1.6; }\n'
+    'h1 { color: #1a365d; }\n'
+    'h2 { color: #2c5282; border-bottom: 1px solid #e2e8f0; padding-bottom: 0.5rem; }\n'
+    '.confidence { background: #f7fafc; padding: 1rem; border-radius: 0.5rem; }\n'
+    '.warning { background: #fffbeb; border-left: 4px solid #f59e0b; padding: 1rem; }\n'
+    '</style>\n'
+    '</head>\n'
+    '<body>\n'
+)
+
+
+# Body-text escapes for section content; one translate pass per section
+_HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+
+@functools.lru_cache(maxsize=8)
+def _html_prologue(language: str) -> str:
+    """Render the doctype, head and page title for a language once."""
+    direction = "rtl" if language == "ar" else "ltr"
+    title = _HEADINGS.get(language) or _HEADINGS["en"]
+    return (
+        '<!DOCTYPE html>\n'
+        f'<html lang="{language}" dir="{direction}">\n'
+        f'{_HTML_HEAD}'
+        f'<h1>{title}</h1>\n'
+    )
 
 
 class HTMLFormatter(OutputFormatter):
     """Formats output as HTML."""
     
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the formatter."""
-        self.standards = OutputStandards()
+        # Standards are read-only at render time, so all formatters share one
+        self.standards = STANDARDS
     
     def format(
         self,
@@ -106,41 +179,29 @@ class HTMLFormatter(OutputFormatter):
         language: str = "en",
     ) -> str:
         """Format as HTML."""
-        direction = "rtl" if language == "ar" else "ltr"
+        buf = io.StringIO()
+        write = buf.write
         
-        lines = [
-            f'<!DOCTYPE html>',
-            f'<html lang="{language}" dir="{direction}">',
-            '<head>',
-            '<meta charset="UTF-8">',
-            '<meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            '<title>Research Analysis</title>',
-            '<style>',
-            'body { font-family: system-ui, sans-serif; max-width: 800px; margin: 0 auto; padding: 2rem; line-height: 1.6; }',
-            'h1 { color: #1a365d; }',
-            'h2 { color: #2c5282; border-bottom: 1px solid #e2e8f0; padding-bottom: 0.5rem; }',
-            '.confidence { background: #f7fafc; padding: 1rem; border-radius: 0.5rem; }',
-            '.warning { background: #fffbeb; border-left: 4px solid #f59e0b; padding: 1rem; }',
-            '</style>',
-            '</head>',
-            '<body>',
-        ]
-        
-        # Title
-        title = "تحليل بحثي" if language == "ar" else "Research Analysis"
-        lines.append(f'<h1>{title}</h1>')
+        # Doctype, head and page title
+        write(_html_prologue(language))
         
         # Sections
-        for section in self.standards.SECTION_ORDER:
-            content = sections.get(section)
+        sections_get = sections.get
+        for section, title in self.standards.get_ordered_titles(language):
+            content = sections_get(section)
             if content:
-                title = self.standards.get_section_title(section, language)
-                lines.append(f'<h2>{title}</h2>')
-                lines.append(f'<p>{content}</p>')
+                write(f'<h2>{title}</h2>\n<p>{content.translate(_HTML_ESCAPE)}</p>\n')
         
-        lines.extend(['</body>', '</html>'])
+        write('</body>\n</html>')
         
-        return '\n'.join(lines)
+        return buf.getvalue()
+
+
+# Formatters hold no per-render state, so one instance of each is reused
+_FORMATTERS: Dict[str, OutputFormatter] = {
+    "markdown": MarkdownFormatter(),
+    "html": HTMLFormatter(),
+}
 
 
 def format_research_output(
@@ -161,12 +222,5 @@ def format_research_output(
     Returns:
         Formatted output string
     """
-    formatters = {
-        "markdown": MarkdownFormatter,
-        "html": HTMLFormatter,
-    }
-    
-    formatter_class = formatters.get(format_type, MarkdownFormatter)
-    formatter = formatter_class()
-    
+    formatter = _FORMATTERS.get(format_type) or _FORMATTERS["markdown"]
     return formatter.format(sections, metadata, language)
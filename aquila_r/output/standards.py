@@ -5,9 +5,10 @@ Defines the standard structure and requirements for
 all research outputs.
 """
 
-from typing import Dict, List, Optional, Any
+import io
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from enum import Enum
-from pydantic import BaseModel, Field
 
 
 class OutputSection(str, Enum):
@@ -22,15 +23,92 @@ class OutputSection(str, Enum):
     ASSUMPTIONS = "assumptions"
 
 
-class SectionRequirement(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SectionRequirement:
     """Requirements for an output section."""
     
     section: OutputSection
-    required: bool = Field(default=True)
-    min_content_length: int = Field(default=0)
-    must_cite_sources: bool = Field(default=False)
-    must_flag_uncertainty: bool = Field(default=False)
-    bilingual_required: bool = Field(default=False)
+    required: bool = True
+    min_content_length: int = 0
+    must_cite_sources: bool = False
+    must_flag_uncertainty: bool = False
+    bilingual_required: bool = False
+
+
+# Section requirements, built once and shared by all OutputStandards
+_DEFAULT_REQUIREMENTS: Dict[OutputSection, SectionRequirement] = {
+    OutputSection.CONTEXT: SectionRequirement(
+        section=OutputSection.CONTEXT,
+        required=True,
+        min_content_length=50,
+    ),
+    OutputSection.METHODOLOGY: SectionRequirement(
+        section=OutputSection.METHODOLOGY,
+        required=True,
+        min_content_length=100,
+        must_flag_uncertainty=True,
+    ),
+    OutputSection.EVIDENCE: SectionRequirement(
+        section=OutputSection.EVIDENCE,
+        required=True,
+        must_cite_sources=True,
+        must_flag_uncertainty=True,
+    ),
+    OutputSection.ANALYSIS: SectionRequirement(
+        section=OutputSection.ANALYSIS,
+        required=True,
+        min_content_length=200,
+    ),
+    OutputSection.GAPS: SectionRequirement(
+        section=OutputSection.GAPS,
+        required=True,
+    ),
+    OutputSection.NEXT_STEPS: SectionRequirement(
+        section=OutputSection.NEXT_STEPS,
+        required=False,
+    ),
+    OutputSection.SOURCES: SectionRequirement(
+        section=OutputSection.SOURCES,
+        required=True,
+    ),
+    OutputSection.ASSUMPTIONS: SectionRequirement(
+        section=OutputSection.ASSUMPTIONS,
+        required=True,
+    ),
+}
+
+
+def _build_validation_plan(
+    requirements: Dict[OutputSection, SectionRequirement],
+) -> Tuple[Tuple[OutputSection, bool, int, str], ...]:
+    """(section, required, min length, missing message) per requirement."""
+    return tuple(
+        (
+            section,
+            requirement.required,
+            requirement.min_content_length,
+            f"Missing required section: {section.value}",
+        )
+        for section, requirement in requirements.items()
+    )
+
+
+_DEFAULT_VALIDATION_PLAN = _build_validation_plan(_DEFAULT_REQUIREMENTS)
+
+
+def _order_titles(
+    order: Sequence[OutputSection],
+    titles: Dict[Tuple[OutputSection, str], str],
+    languages: Sequence[str],
+) -> Dict[str, Tuple[Tuple[OutputSection, str], ...]]:
+    """Pair each section in order with its title, per language."""
+    return {
+        language: tuple(
+            (section, titles.get((section, language)) or titles[(section, "en")])
+            for section in order
+        )
+        for language in languages
+    }
 
 
 class OutputStandards:
@@ -65,64 +143,54 @@ class OutputStandards:
         OutputSection.ASSUMPTIONS: {"en": "Assumptions", "ar": "الافتراضات"},
     }
     
-    def __init__(self):
+    # Flattened (section, language) -> title lookup
+    _TITLES = {
+        (section, language): title
+        for section, titles in SECTION_TITLES.items()
+        for language, title in titles.items()
+    }
+    
+    # (section, title) pairs in SECTION_ORDER, per language
+    _ORDERED_TITLES = _order_titles(SECTION_ORDER, _TITLES, ("en", "ar"))
+    
+    def __init__(self) -> None:
         """Initialize output standards."""
         self._requirements = self._define_requirements()
+        self._template_cache: Dict[str, str] = {}
+        # Reuse the prebuilt plan unless a subclass defines its own requirements
+        if self._requirements is _DEFAULT_REQUIREMENTS:
+            self._validation_plan = _DEFAULT_VALIDATION_PLAN
+        else:
+            self._validation_plan = _build_validation_plan(self._requirements)
+        self._required_sections = tuple(
+            section for section, required, _, _ in self._validation_plan if required
+        )
     
     def _define_requirements(self) -> Dict[OutputSection, SectionRequirement]:
-        """Define section requirements."""
-        return {
-            OutputSection.CONTEXT: SectionRequirement(
-                section=OutputSection.CONTEXT,
-                required=True,
-                min_content_length=50,
-            ),
-            OutputSection.METHODOLOGY: SectionRequirement(
-                section=OutputSection.METHODOLOGY,
-                required=True,
-                min_content_length=100,
-                must_flag_uncertainty=True,
-            ),
-            OutputSection.EVIDENCE: SectionRequirement(
-                section=OutputSection.EVIDENCE,
-                required=True,
-                must_cite_sources=True,
-                must_flag_uncertainty=True,
-            ),
-            OutputSection.ANALYSIS: SectionRequirement(
-                section=OutputSection.ANALYSIS,
-                required=True,
-                min_content_length=200,
-            ),
-            OutputSection.GAPS: SectionRequirement(
-                section=OutputSection.GAPS,
-                required=True,
-            ),
-            OutputSection.NEXT_STEPS: SectionRequirement(
-                section=OutputSection.NEXT_STEPS,
-                required=False,
-            ),
-            OutputSection.SOURCES: SectionRequirement(
-                section=OutputSection.SOURCES,
-                required=True,
-            ),
-            OutputSection.ASSUMPTIONS: SectionRequirement(
-                section=OutputSection.ASSUMPTIONS,
-                required=True,
-            ),
-        }
+        """Define section requirements (shared, treat as read-only)."""
+        return _DEFAULT_REQUIREMENTS
     
     def get_section_title(self, section: OutputSection, language: str = "en") -> str:
         """Get section title in specified language."""
-        titles = self.SECTION_TITLES.get(section, {})
-        return titles.get(language, titles.get("en", section.value))
+        return (
+            self._TITLES.get((section, language))
+            or self._TITLES.get((section, "en"), section.value)
+        )
+    
+    def get_ordered_titles(
+        self,
+        language: str = "en",
+    ) -> Tuple[Tuple[OutputSection, str], ...]:
+        """Get (section, title) pairs in standard order for a language."""
+        ordered = self._ORDERED_TITLES.get(language)
+        if ordered is None:
+            # Unknown languages fall back to English titles
+            ordered = self._ORDERED_TITLES["en"]
+        return ordered
     
-    def get_required_sections(self) -> List[OutputSection]:
-        """Get list of required sections."""
-        return [
-            s for s, req in self._requirements.items() 
-            if req.required
-        ]
+    def get_required_sections(self) -> Tuple[OutputSection, ...]:
+        """Get required sections, in requirement order."""
+        return self._required_sections
     
     def validate_output(
         self,
@@ -138,20 +206,22 @@ class OutputStandards:
             List of validation issues
         """
         issues = []
+        sections_get = sections.get
         
-        for section, requirement in self._requirements.items():
-            content = sections.get(section, "")
+        for section, required, min_length, missing_message in self._validation_plan:
+            content = sections_get(section)
             
             # Check required sections
-            if requirement.required and not content:
-                issues.append(f"Missing required section: {section.value}")
+            if not content:
+                if required:
+                    issues.append(missing_message)
                 continue
             
             # Check minimum length
-            if content and len(content) < requirement.min_content_length:
+            if len(content) < min_length:
                 issues.append(
                     f"Section {section.value} below minimum length "
-                    f"({len(content)} < {requirement.min_content_length})"
+                    f"({len(content)} < {min_length})"
                 )
         
         return issues
@@ -166,28 +236,44 @@ class OutputStandards:
         Returns:
             Template string
         """
-        lines = []
+        # The template depends only on language for a given instance
+        template = self._template_cache.get(language)
+        if template is None:
+            template = self._template_cache[language] = self._render_template(language)
+        return template
+    
+    def _render_template(self, language: str) -> str:
+        """Render the output template for a language."""
+        buf = io.StringIO()
+        write = buf.write
         
-        for section in self.SECTION_ORDER:
-            title = self.get_section_title(section, language)
+        for i, (section, title) in enumerate(self.get_ordered_titles(language)):
             requirement = self._requirements.get(section)
             
+            # Sections are separated by a blank line
+            if i:
+                write("\n")
+            
             required_marker = "*" if requirement and requirement.required else ""
-            lines.append(f"## {title}{required_marker}\n")
+            write(f"## {title}{required_marker}\n\n")
             
             # Add guidance
             if requirement:
                 if requirement.must_cite_sources:
                     if language == "ar":
-                        lines.append("*يجب ذكر المصادر*\n")
+                        write("*يجب ذكر المصادر*\n\n")
                     else:
-                        lines.append("*Must cite sources*\n")
+                        write("*Must cite sources*\n\n")
                 if requirement.must_flag_uncertainty:
                     if language == "ar":
-                        lines.append("*الإشارة إلى عدم اليقين*\n")
+                        write("*الإشارة إلى عدم اليقين*\n\n")
                     else:
-                        lines.append("*Flag uncertainty where appropriate*\n")
+                        write("*Flag uncertainty where appropriate*\n\n")
             
-            lines.append("\n")
+            write("\n")
         
-        return "\n".join(lines)
+        return buf.getvalue()
+
+
+# Shared instance for read-only use; its template cache is filled once
+STANDARDS = OutputStandards()
@@ -6,7 +6,7 @@ external tools for retrieval, parsing, and verification.
 """
 
 from aquila_r.tools.base import BaseTool, ToolResult, ToolError
-from aquila_r.tools.retrieval import RetrievalTool, SearchResult
+from aquila_r.tools.retrieval import RetrievalTool, SearchResult, search_many
 from aquila_r.tools.parsing import DocumentParser, ParsedDocument
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     "ToolError",
     "RetrievalTool",
     "SearchResult",
+    "search_many",
     "DocumentParser",
     "ParsedDocument",
 ]
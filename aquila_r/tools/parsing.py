@@ -5,21 +5,25 @@ Provides tools for extracting content from various
 document formats (PDF, etc.).
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+import io
+import os
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Any, Sequence
 from pydantic import BaseModel, Field
-from pathlib import Path
 from abc import abstractmethod
 
 from aquila_r.tools.base import BaseTool, ToolResult, ToolStatus
 
 
-class ParsedSection(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ParsedSection:
     """A section from a parsed document."""
     
     heading: Optional[str] = None
     content: str
     page_number: Optional[int] = None
-    section_type: str = Field(default="body")  # abstract, body, references, etc.
+    section_type: str = "body"  # abstract, body, references, etc.
 
 
 class ParsedDocument(BaseModel):
@@ -37,14 +41,22 @@ class ParsedDocument(BaseModel):
     
     def get_full_text(self) -> str:
         """Get full document text."""
-        parts = []
+        buf = io.StringIO()
+        write = buf.write
+        
+        # Parts are separated by a blank line
+        separator = ""
         if self.abstract:
-            parts.append(self.abstract)
+            write(self.abstract)
+            separator = "\n\n"
         for section in self.sections:
             if section.heading:
-                parts.append(f"\n{section.heading}\n")
-            parts.append(section.content)
-        return "\n\n".join(parts)
+                write(f"{separator}\n{section.heading}\n")
+                separator = "\n\n"
+            write(separator)
+            write(section.content)
+            separator = "\n\n"
+        return buf.getvalue()
     
     def get_section_by_type(self, section_type: str) -> List[ParsedSection]:
         """Get sections of a specific type."""
@@ -61,7 +73,7 @@ class DocumentParser(BaseTool):
     
     name = "document_parser"
     description = "Base document parser"
-    supported_formats: List[str] = []
+    supported_formats: FrozenSet[str] = frozenset()
     
     @abstractmethod
     async def parse(self, source: str) -> ParsedDocument:
@@ -76,6 +88,18 @@ class DocumentParser(BaseTool):
         """
         pass
     
+    async def parse_many(self, sources: Sequence[str]) -> List[ParsedDocument]:
+        """
+        Parse several documents concurrently.
+        
+        Args:
+            sources: Paths to documents or URLs
+            
+        Returns:
+            ParsedDocuments in the same order as sources
+        """
+        return list(await asyncio.gather(*(self.parse(source) for source in sources)))
+    
     async def execute(self, **kwargs) -> ToolResult:
         """Execute parsing."""
         source = kwargs.get("source", "")
@@ -95,7 +119,7 @@ class DocumentParser(BaseTool):
     
     def supports_format(self, path: str) -> bool:
         """Check if format is supported."""
-        ext = Path(path).suffix.lower().lstrip(".")
+        ext = os.path.splitext(path.rstrip("/"))[1][1:].lower()
         return ext in self.supported_formats
 
 
@@ -104,7 +128,7 @@ class PDFParser(DocumentParser):
     
     name = "pdf_parser"
     description = "Parse PDF documents"
-    supported_formats = ["pdf"]
+    supported_formats = frozenset({"pdf"})
     
     async def parse(self, source: str) -> ParsedDocument:
         """Parse a PDF document."""
@@ -115,18 +139,24 @@ class PDFParser(DocumentParser):
         )
 
 
+def _read_text(source: str) -> str:
+    """Read a UTF-8 text file."""
+    with open(source, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 class TextParser(DocumentParser):
     """Parser for plain text documents."""
     
     name = "text_parser"
     description = "Parse text documents"
-    supported_formats = ["txt", "md", "markdown"]
+    supported_formats = frozenset({"txt", "md", "markdown"})
     
     async def parse(self, source: str) -> ParsedDocument:
         """Parse a text document."""
         try:
-            with open(source, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read off the event loop so concurrent parses are not blocked
+            content = await asyncio.to_thread(_read_text, source)
             
             return ParsedDocument(
                 source_path=source,
@@ -5,7 +5,9 @@ Provides interfaces for retrieving academic sources
 from various repositories.
 """
 
-from typing import Dict, List, Optional, Any
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 from pydantic import BaseModel, Field
 from datetime import datetime
 from abc import abstractmethod
@@ -45,6 +47,16 @@ class RetrievalTool(BaseTool):
     name = "retrieval_tool"
     description = "Base retrieval tool"
     
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """Initialize the tool and its result cache."""
+        super().__init__(config)
+        # Successful results by (query, max_results, language), held as
+        # private copies; a cache_size of 0 disables caching
+        self._cache: OrderedDict[
+            Tuple[str, int, Optional[str]], ToolResult[List[SearchResult]]
+        ] = OrderedDict()
+        self._cache_max: int = self.config.get("cache_size", 256)
+    
     @abstractmethod
     async def search(
         self,
@@ -74,15 +86,30 @@ class RetrievalTool(BaseTool):
         if not query:
             return self._failure("No query provided")
         
+        key = (query, max_results, language)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            # Each caller gets its own copy, stamped when it was served
+            return cached.model_copy(
+                update={"timestamp": datetime.utcnow()}, deep=True,
+            )
+        
         try:
             results = await self.search(query, max_results, language)
-            return self._success(
-                data=results,
-                query=query,
-                result_count=len(results),
-            )
         except Exception as e:
             return self._failure(str(e))
+        
+        result = self._success(
+            data=results,
+            query=query,
+            result_count=len(results),
+        )
+        if self._cache_max > 0:
+            self._cache[key] = result.model_copy(deep=True)
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+        return result
 
 
 class ArxivTool(RetrievalTool):
@@ -135,3 +162,44 @@ class SemanticScholarTool(RetrievalTool):
         """Search Semantic Scholar."""
         # Placeholder - requires API integration
         return []
+
+
+async def search_many(
+    tools: Sequence[RetrievalTool],
+    query: str,
+    max_results: int = 10,
+    language: Optional[str] = None,
+) -> List[ToolResult[Any]]:
+    """
+    Run the same search on several retrieval tools concurrently.
+    
+    Each tool goes through execute, so its error handling and result
+    cache apply. A tool that raises anyway yields a failure result
+    rather than discarding the other tools' results.
+    
+    Args:
+        tools: Retrieval tools to query
+        query: Search query
+        max_results: Maximum results per tool
+        language: Filter by language
+        
+    Returns:
+        One result per tool, in tool order
+    """
+    outcomes = await asyncio.gather(
+        *(
+            tool.execute(query=query, max_results=max_results, language=language)
+            for tool in tools
+        ),
+        return_exceptions=True,
+    )
+    
+    results = []
+    for tool, outcome in zip(tools, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                # Cancellation and interpreter exits are not tool failures
+                raise outcome
+            outcome = tool._failure(str(outcome))
+        results.append(outcome)
+    return results
@@ -2,80 +2,97 @@
 Basic Usage Example for Aquila-R.
 
 Demonstrates core functionality of the research agent.
+
+Run all examples, or name the ones to run:
+
+    python basic_usage.py glossary claims
+
+Package modules are imported inside the examples that use them, so a
+selective run only loads what it needs.
 """
 
-from aquila_r import AquilaR, AquilaConfig
-from aquila_r.core.config import MethodologyParadigm, OutputLanguage
-from aquila_r.language import LanguageDetector, TechnicalGlossary
-from aquila_r.methodology import AssumptionTracker, ClaimValidator
+import argparse
+import asyncio
+import io
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from aquila_r import AquilaR
+    from aquila_r.language import LanguageDetector, TechnicalGlossary
 
 
-def example_basic_analysis():
+# Upper bound on analyses in flight, to respect provider rate limits
+MAX_CONCURRENT_ANALYSES = 4
+
+
+async def example_basic_analysis(agent: "AquilaR", semaphore: asyncio.Semaphore) -> str:
     """Basic research analysis example."""
-    print("=" * 60)
-    print("EXAMPLE 1: Basic Research Analysis")
-    print("=" * 60)
+    from aquila_r.core.config import MethodologyParadigm
     
-    # Initialize agent with default configuration
-    agent = AquilaR()
+    out = io.StringIO()
+    print("=" * 60, file=out)
+    print("EXAMPLE 1: Basic Research Analysis", file=out)
+    print("=" * 60, file=out)
     
     # Check status
-    status = agent.get_status()
-    print(f"\nAgent: {status['agent']} v{status['version']}")
-    print(f"LLM Configured: {status['llm_configured']}")
+    status = await agent.aget_status()
+    print(f"\nAgent: {status['agent']} v{status['version']}", file=out)
+    print(f"LLM Configured: {status['llm_configured']}", file=out)
     
     # Perform analysis
     query = "What are the main theoretical debates on state formation in the MENA region?"
     
-    print(f"\nQuery: {query}\n")
+    print(f"\nQuery: {query}\n", file=out)
     
-    result = agent.analyze(
-        query=query,
-        modules=["literature", "synthesis", "critical"],
-        methodology=MethodologyParadigm.INTERPRETIVIST,
-    )
+    async with semaphore:
+        result = await agent.aanalyze(
+            query=query,
+            modules=["literature", "synthesis", "critical"],
+            methodology=MethodologyParadigm.INTERPRETIVIST,
+        )
     
     # Print result
-    print(result.to_markdown())
+    print(result.to_markdown(), file=out)
+    return out.getvalue()
 
 
-def example_arabic_analysis():
+async def example_arabic_analysis(agent: "AquilaR", semaphore: asyncio.Semaphore) -> str:
     """Arabic research analysis example."""
-    print("\n" + "=" * 60)
-    print("EXAMPLE 2: Arabic Research Analysis")
-    print("=" * 60)
+    from aquila_r.core.config import OutputLanguage
     
-    agent = AquilaR()
+    out = io.StringIO()
+    print("\n" + "=" * 60, file=out)
+    print("EXAMPLE 2: Arabic Research Analysis", file=out)
+    print("=" * 60, file=out)
     
     # Arabic query
     query = "ما هي النظريات الرئيسية حول تشكل الدولة في المنطقة العربية؟"
     
-    print(f"\nQuery: {query}\n")
+    print(f"\nQuery: {query}\n", file=out)
     
-    result = agent.analyze(
-        query=query,
-        output_language=OutputLanguage.ARABIC,
-    )
+    async with semaphore:
+        result = await agent.aanalyze(
+            query=query,
+            output_language=OutputLanguage.ARABIC,
+        )
     
-    print(result.to_arabic_markdown())
+    print(result.to_arabic_markdown(), file=out)
+    return out.getvalue()
 
 
-def example_language_detection():
+def example_language_detection(detector: "LanguageDetector"):
     """Language detection example."""
     print("\n" + "=" * 60)
     print("EXAMPLE 3: Language Detection")
     print("=" * 60)
     
-    detector = LanguageDetector()
-    
     texts = [
         "The state formation process in the Arab world differs significantly from European models.",
         "تختلف عملية تشكل الدولة في العالم العربي اختلافاً كبيراً عن النماذج الأوروبية.",
         "The concept of دولة (dawla) has evolved over time in Arabic political thought.",
     ]
     
-    for text in texts:
-        score = detector.detect(text)
+    for text, score in zip(texts, detector.detect_batch(texts), strict=True):
         print(f"\nText: {text[:50]}...")
         print(f"  Primary: {score.primary}")
         print(f"  English: {score.english:.2f}")
@@ -83,14 +100,12 @@ def example_language_detection():
         print(f"  Mixed: {score.mixed}")
 
 
-def example_glossary():
+def example_glossary(glossary: "TechnicalGlossary"):
     """Technical glossary example."""
     print("\n" + "=" * 60)
     print("EXAMPLE 4: Technical Glossary")
     print("=" * 60)
     
-    glossary = TechnicalGlossary()
-    
     # Show summary
     summary = glossary.get_summary()
     print(f"\nGlossary has {summary['total_entries']} entries")
@@ -116,6 +131,8 @@ def example_glossary():
 
 def example_assumption_tracking():
     """Assumption tracking example."""
+    from aquila_r.methodology import AssumptionTracker
+    
     print("\n" + "=" * 60)
     print("EXAMPLE 5: Assumption Tracking")
     print("=" * 60)
@@ -149,6 +166,8 @@ def example_assumption_tracking():
 
 def example_claim_validation():
     """Claim validation example."""
+    from aquila_r.methodology import ClaimValidator
+    
     print("\n" + "=" * 60)
     print("EXAMPLE 6: Claim Validation")
     print("=" * 60)
@@ -164,8 +183,9 @@ def example_claim_validation():
     
     print("\nValidating claims:\n")
     
-    for claim in claims:
-        validation = validator.validate_claim(claim)
+    result = validator.validate_claims(claims)
+    
+    for claim, validation in zip(claims, result.claim_validations, strict=True):
         print(f"Claim: {claim[:60]}...")
         print(f"  Status: {validation.status.value}")
         print(f"  Strength: {validation.strength.value}")
@@ -176,14 +196,12 @@ def example_claim_validation():
         print()
 
 
-def example_project_memory():
+def example_project_memory(agent: "AquilaR"):
     """Project memory example."""
     print("\n" + "=" * 60)
     print("EXAMPLE 7: Project Memory")
     print("=" * 60)
     
-    agent = AquilaR()
-    
     # Create a project
     project_id = agent.create_project(
         name="State Formation Study",
@@ -219,20 +237,63 @@ def example_project_memory():
     print(f"  Assumptions: {len(summary['assumptions'])}")
 
 
-def main():
-    """Run all examples."""
+async def run_analysis_examples(agent: "AquilaR") -> List[str]:
+    """Run the LLM-backed examples concurrently, bounded by a semaphore."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+    return await asyncio.gather(
+        example_basic_analysis(agent, semaphore),
+        example_arabic_analysis(agent, semaphore),
+    )
+
+
+# Example names accepted on the command line, in run order
+EXAMPLES = ("analysis", "language", "glossary", "assumptions", "claims", "memory")
+
+
+def main(argv: Optional[List[str]] = None):
+    """Run the selected examples, or all of them."""
+    parser = argparse.ArgumentParser(description="Aquila-R usage examples")
+    parser.add_argument(
+        "examples",
+        nargs="*",
+        metavar="EXAMPLE",
+        help=f"Examples to run, from: {', '.join(EXAMPLES)} (default: all)",
+    )
+    names = parser.parse_args(argv).examples
+    unknown = sorted(set(names) - set(EXAMPLES))
+    if unknown:
+        parser.error(f"unknown example(s): {', '.join(unknown)}")
+    selected = set(names or EXAMPLES)
+    
     print("\n" + "=" * 60)
     print("AQUILA-R: Research Agent Examples")
     print("=" * 60)
     
-    # Run examples
-    example_basic_analysis()
-    example_arabic_analysis()
-    example_language_detection()
-    example_glossary()
-    example_assumption_tracking()
-    example_claim_validation()
-    example_project_memory()
+    # Shared agent, built once for the examples that need it
+    agent = None
+    if selected & {"analysis", "memory"}:
+        from aquila_r import AquilaR
+        agent = AquilaR()  # default configuration
+    
+    # The analysis examples wait on the LLM, so run them concurrently
+    # and print their output in order once both are done
+    if "analysis" in selected:
+        for output in asyncio.run(run_analysis_examples(agent)):
+            print(output, end="")
+    
+    # Run the local examples
+    if "language" in selected:
+        from aquila_r.language import LanguageDetector
+        example_language_detection(LanguageDetector())
+    if "glossary" in selected:
+        from aquila_r.language import TechnicalGlossary
+        example_glossary(TechnicalGlossary())
+    if "assumptions" in selected:
+        example_assumption_tracking()
+    if "claims" in selected:
+        example_claim_validation()
+    if "memory" in selected:
+        example_project_memory(agent)
     
     print("\n" + "=" * 60)
     print("Examples complete!")
@@ -0,0 +1,46 @@
+"""
+Shared fixtures for the Aquila-R test suite.
+
+Session-scoped instances are for read-only tests; tests that mutate
+state construct their own.
+"""
+
+import pytest
+
+from aquila_r import AquilaR
+from aquila_r.language import (
+    LanguageDetector,
+    ConceptualTranslator,
+    TechnicalGlossary,
+)
+from aquila_r.methodology import MethodologyFramework
+
+
+@pytest.fixture(scope="session")
+def agent():
+    """Shared agent for tests that do not change its state."""
+    return AquilaR()
+
+
+@pytest.fixture(scope="session")
+def glossary():
+    """Shared default glossary for lookup-only tests."""
+    return TechnicalGlossary()
+
+
+@pytest.fixture(scope="session")
+def framework():
+    """Shared methodology framework."""
+    return MethodologyFramework()
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """Shared language detector."""
+    return LanguageDetector()
+
+
+@pytest.fixture(scope="session")
+def translator():
+    """Shared conceptual translator."""
+    return ConceptualTranslator()
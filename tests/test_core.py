@@ -4,7 +4,9 @@ Test suite for Aquila-R core components.
 Run with: pytest tests/ -v
 """
 
+import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from aquila_r import AquilaR, AquilaConfig
@@ -20,6 +22,7 @@ from aquila_r.core.memory import (
     MemoryItemType,
     ProjectContext,
 )
+from aquila_r.core.memory_sqlite import SQLiteMemoryIndex
 from aquila_r.core.config import (
     LLMProvider,
     MethodologyParadigm,
@@ -184,6 +187,178 @@ class TestResearchMemory:
         assert summary["items_by_type"]["finding"] == 2
         assert summary["items_by_type"]["assumption"] == 1
     
+    def test_memory_search(self):
+        """Test full-text search over session memory."""
+        memory = ResearchMemory()
+        memory.record_finding("Tribal governance shapes local courts", confidence=0.8)
+        memory.record_finding("Oil revenue funds the budget", confidence=0.7)
+        memory.record_assumption("Governance data is incomplete")
+        
+        results = memory.search("governance")
+        findings = memory.search("governance", item_types=[MemoryItemType.FINDING])
+        
+        assert len(results) == 2
+        assert [i.content for i in findings] == ["Tribal governance shapes local courts"]
+        assert memory.search("") == []
+    
+    def test_memory_search_after_direct_edits(self):
+        """Test search reflects items replaced or edited in place."""
+        memory = ResearchMemory()
+        memory.record_finding("alpha finding", confidence=0.8)
+        memory.record_finding("beta finding", confidence=0.7)
+        assert len(memory.search("alpha")) == 1
+        
+        memory.session_items[0] = MemoryItem.create(
+            type=MemoryItemType.FINDING,
+            content="State legitimacy erodes",
+        )
+        
+        assert memory.search("alpha") == []
+        assert len(memory.search("legitimacy")) == 1
+        
+        memory.session_items[1].content = "gamma finding"
+        
+        assert memory.search("beta") == []
+        assert len(memory.search("gamma")) == 1
+        assert memory.get_session_summary()["items_by_type"] == {"finding": 2}
+        
+        memory.session_items[0] = MemoryItem.create(
+            type=MemoryItemType.ASSUMPTION,
+            content="Courts follow custom",
+        )
+        
+        # Summaries skip the per-item check; the next search resyncs
+        assert len(memory.search("custom")) == 1
+        assert memory.get_session_summary()["items_by_type"] == {
+            "assumption": 1,
+            "finding": 1,
+        }
+    
+    def test_session_summary_counts(self):
+        """Test type counts follow adds, pruning, direct appends and clearing."""
+        memory = ResearchMemory(max_items=3)
+        memory.record_finding("Finding A", confidence=0.9)
+        memory.record_assumption("Assumption A")
+        memory.record_finding("Finding B", confidence=0.95)
+        
+        summary = memory.get_session_summary()["items_by_type"]
+        assert list(summary.items()) == [("finding", 2), ("assumption", 1)]
+        
+        memory.record_findings(["Finding C", "Finding D"], confidence=0.99)
+        assert memory.get_session_summary()["items_by_type"] == {
+            "finding": 2,
+            "assumption": 1,
+        }
+        
+        memory.session_items.append(
+            MemoryItem.create(type=MemoryItemType.QUERY, content="Query")
+        )
+        assert memory.get_session_summary()["items_by_type"] == {
+            "finding": 2,
+            "assumption": 1,
+            "query": 1,
+        }
+        
+        memory.clear_session()
+        assert memory.get_session_summary()["items_by_type"] == {}
+    
+    def test_memory_from_another_thread(self):
+        """Test memory created in one thread can be used from another."""
+        memory = ResearchMemory()
+        memory.record_finding("alpha finding")
+        
+        def work():
+            memory.record_assumption("Sources are representative")
+            return memory.get_session_summary(), memory.search("alpha")
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            summary, found = pool.submit(work).result()
+        
+        assert summary["total_items"] == 2
+        assert [item.content for item in found] == ["alpha finding"]
+    
+    def test_memory_search_without_fts5(self, monkeypatch):
+        """Test search falls back to scanning when SQLite lacks FTS5."""
+        monkeypatch.setattr(
+            SQLiteMemoryIndex, "_SCHEMA", "CREATE VIRTUAL TABLE items USING no_such_module()"
+        )
+        memory = ResearchMemory()
+        memory.record_finding("State_building in the Levant")
+        memory.record_finding("Levant state formation", confidence=0.7)
+        memory.record_assumption("Formation is gradual")
+        
+        found = memory.search("state formation", item_types=[MemoryItemType.FINDING])
+        
+        assert [item.content for item in found] == [
+            "Levant state formation",
+            "State_building in the Levant",
+        ]
+        assert memory.search("absent") == []
+        assert memory.get_session_summary()["items_by_type"] == {
+            "assumption": 1,
+            "finding": 2,
+        }
+    
+    def test_memory_close(self):
+        """Test memory keeps working after its index is closed."""
+        memory = ResearchMemory()
+        memory.record_finding("alpha finding")
+        
+        memory.close()
+        memory.close()
+        memory.record_finding("beta finding")
+        
+        assert [item.content for item in memory.search("beta")] == ["beta finding"]
+        assert memory.get_session_summary()["items_by_type"] == {"finding": 2}
+    
+    def test_record_findings(self):
+        """Test recording several findings at once."""
+        memory = ResearchMemory(max_items=2)
+        project = memory.create_project("Batch Project")
+        
+        findings = memory.record_findings(
+            ["Finding A", "Finding B", "Finding C"],
+            confidence=0.6,
+        )
+        
+        assert len(findings) == 3
+        assert all(f.relevance_score == 0.6 for f in findings)
+        assert len(memory.session_items) == 2
+        assert len(project.findings) == 3
+        assert memory.get_session_summary()["items_by_type"] == {"finding": 2}
+    
+    def test_batch_recording_matches_single_calls(self):
+        """Test batch adds leave memory and project as repeated single calls."""
+        confidences = [0.6, 0.9, 0.3, 0.9, 0.6]
+        batch, single = ResearchMemory(max_items=3), ResearchMemory(max_items=3)
+        batch_project = batch.create_project("Batch")
+        single_project = single.create_project("Single")
+        
+        for confidence in confidences:
+            batch.record_findings([f"Finding {confidence}"], confidence=confidence)
+            single.record_finding(f"Finding {confidence}", confidence=confidence)
+        batch.record_findings(["A", "B"], confidence=0.7)
+        for content in ["A", "B"]:
+            single.record_finding(content, confidence=0.7)
+        
+        items = [
+            MemoryItem.create(type=MemoryItemType.QUERY, content=f"Query {i}")
+            for i in range(3)
+        ]
+        batch.add_items(items)
+        for item in items:
+            single.add_item(item)
+        
+        def contents(memory_items):
+            return [item.content for item in memory_items]
+        
+        assert contents(batch.session_items) == contents(single.session_items)
+        assert contents(batch_project.findings) == contents(single_project.findings)
+        assert len(batch_project.findings) == len(confidences) + 2
+        assert batch.get_session_summary()["items_by_type"] == (
+            single.get_session_summary()["items_by_type"]
+        )
+    
     def test_memory_export_import(self):
         """Test memory export and import."""
         memory = ResearchMemory()
@@ -198,15 +373,32 @@ class TestResearchMemory:
         
         assert len(imported.session_items) == 1
         assert len(imported.projects) == 1
+    
+    def test_memory_export_data(self):
+        """Test export parses to the models' JSON-mode dumps."""
+        memory = ResearchMemory()
+        memory.record_finding("نتيجة صغيرة", confidence=0.00001, language="ar")
+        memory.create_project("Test Project")
+        
+        exported = json.loads(memory.export_to_json())
+        
+        assert exported == {
+            "session_items": [
+                item.model_dump(mode="json") for item in memory.session_items
+            ],
+            "projects": {
+                pid: project.model_dump(mode="json")
+                for pid, project in memory.projects.items()
+            },
+            "active_project_id": memory.active_project_id,
+        }
 
 
 class TestAquilaRAgent:
     """Tests for main agent."""
     
-    def test_agent_creation(self):
+    def test_agent_creation(self, agent):
         """Test agent is created correctly."""
-        agent = AquilaR()
-        
         assert agent.identity.name == "Aquila-R"
         assert agent.memory is not None
     
@@ -221,10 +413,8 @@ class TestAquilaRAgent:
         assert agent.config.debug
         assert agent.config.log_level == "DEBUG"
     
-    def test_language_detection(self):
+    def test_language_detection(self, agent):
         """Test language detection."""
-        agent = AquilaR()
-        
         assert agent._detect_language("This is English text") == "en"
         assert agent._detect_language("هذا نص عربي") == "ar"
     
@@ -241,9 +431,8 @@ class TestAquilaRAgent:
         assert result.methodology is not None
         assert result.language in ["en", "ar"]
     
-    def test_status(self):
+    def test_status(self, agent):
         """Test agent status."""
-        agent = AquilaR()
         status = agent.get_status()
         
         assert "agent" in status
@@ -3,74 +3,88 @@ Test suite for Aquila-R language components.
 """
 
 import pytest
+from pydantic import ValidationError
 
 from aquila_r.language import (
     LanguageDetector,
-    ConceptualTranslator,
     TechnicalGlossary,
     GlossaryEntry,
 )
+from aquila_r.language.glossary import TermStatus
 from aquila_r.language.translator import TranslationConfidence
 
 
 class TestLanguageDetector:
     """Tests for language detector."""
     
-    def test_english_detection(self):
+    def test_english_detection(self, detector):
         """Test English text detection."""
-        detector = LanguageDetector()
-        
         score = detector.detect("This is a test sentence in English.")
         
         assert score.primary == "en"
         assert score.english > 0.9
         assert not score.mixed
     
-    def test_arabic_detection(self):
+    def test_arabic_detection(self, detector):
         """Test Arabic text detection."""
-        detector = LanguageDetector()
-        
         score = detector.detect("هذه جملة اختبار باللغة العربية.")
         
         assert score.primary == "ar"
         assert score.arabic > 0.9
         assert not score.mixed
     
-    def test_mixed_content(self):
+    def test_mixed_content(self, detector):
         """Test mixed language detection."""
-        detector = LanguageDetector()
-        
         score = detector.detect(
             "The concept of دولة (state) is complex في التاريخ العربي."
         )
         
         assert score.mixed
     
-    def test_empty_text(self):
+    def test_empty_text(self, detector):
         """Test empty text handling."""
-        detector = LanguageDetector()
-        
         score = detector.detect("")
         
         assert score.primary == "unknown"
         assert score.confidence == 0.0
     
-    def test_helper_methods(self):
+    def test_helper_methods(self, detector):
         """Test helper methods."""
-        detector = LanguageDetector()
-        
         assert detector.is_english("This is English")
         assert detector.is_arabic("هذا عربي")
         assert detector.get_primary_language("Hello world") == "en"
+    
+    def test_detect_batch_matches_detect(self):
+        """Test batch detection equals detecting each text in turn."""
+        prefix = "1" * 500
+        texts = [
+            "State formation",
+            "تشكل الدولة",
+            "The concept of دولة (state)",
+            "",
+            "   ",
+            "2024 - 1999",
+            "\0abc\0دولة",
+            "emoji 😀 دولة",
+            prefix,
+            prefix + " state",
+            prefix + " دولة",
+            "State formation",
+            "x" * 600,
+            "x" * 500 + "دولة" * 50,
+        ]
+        
+        batch = LanguageDetector().detect_batch(texts)
+        reference = LanguageDetector()
+        
+        assert batch == [reference.detect(text) for text in texts]
 
 
 class TestConceptualTranslator:
     """Tests for conceptual translator."""
     
-    def test_same_language(self):
+    def test_same_language(self, translator):
         """Test translation when source and target are same."""
-        translator = ConceptualTranslator()
-        
         result = translator.translate(
             text="Test text",
             source_lang="en",
@@ -80,10 +94,8 @@ class TestConceptualTranslator:
         assert result.source_text == result.target_text
         assert result.confidence == TranslationConfidence.HIGH
     
-    def test_untranslatable_detection(self):
+    def test_untranslatable_detection(self, translator):
         """Test detection of untranslatable terms."""
-        translator = ConceptualTranslator()
-        
         flags = translator.flag_untranslatable(
             "The concept of governance is complex.",
             source_lang="en",
@@ -92,20 +104,16 @@ class TestConceptualTranslator:
         assert len(flags) > 0
         assert any(f["term"] == "governance" for f in flags)
     
-    def test_contested_term_lookup(self):
+    def test_contested_term_lookup(self, translator):
         """Test looking up contested terms."""
-        translator = ConceptualTranslator()
-        
         result = translator.get_contested_translation("democracy")
         
         assert result is not None
         assert "primary_translation" in result
         assert "alternatives" in result
     
-    def test_translation_guidance(self):
+    def test_translation_guidance(self, translator):
         """Test getting translation guidance."""
-        translator = ConceptualTranslator()
-        
         guidance = translator.get_translation_guidance(
             text="The state and civil society relationship",
             source_lang="en",
@@ -119,61 +127,47 @@ class TestConceptualTranslator:
 class TestTechnicalGlossary:
     """Tests for technical glossary."""
     
-    def test_glossary_creation(self):
+    def test_glossary_creation(self, glossary):
         """Test glossary is created with defaults."""
-        glossary = TechnicalGlossary()
-        
         summary = glossary.get_summary()
         assert summary["total_entries"] > 0
     
-    def test_term_lookup_english(self):
+    def test_term_lookup_english(self, glossary):
         """Test looking up English terms."""
-        glossary = TechnicalGlossary()
-        
         entry = glossary.get_entry("state", "en")
         
         assert entry is not None
         assert entry.term_en == "state"
         assert entry.term_ar == "دولة"
     
-    def test_term_lookup_arabic(self):
+    def test_term_lookup_arabic(self, glossary):
         """Test looking up Arabic terms."""
-        glossary = TechnicalGlossary()
-        
         entry = glossary.get_entry("دولة", "ar")
         
         assert entry is not None
         assert entry.term_en == "state"
     
-    def test_search(self):
+    def test_search(self, glossary):
         """Test searching the glossary."""
-        glossary = TechnicalGlossary()
-        
         results = glossary.search("governance")
         
         assert len(results) > 0
     
-    def test_translate(self):
+    def test_translate(self, glossary):
         """Test translating a term."""
-        glossary = TechnicalGlossary()
-        
         arabic = glossary.translate("methodology", "en")
         
         assert arabic == "منهجية"
     
-    def test_get_by_domain(self):
+    def test_get_by_domain(self, glossary):
         """Test getting terms by domain."""
-        glossary = TechnicalGlossary()
-        
         entries = glossary.get_by_domain("methodology")
         
         assert len(entries) > 0
         assert all(e.domain == "methodology" for e in entries)
     
-    def test_get_contested(self):
+    def test_get_contested(self, glossary):
         """Test getting contested terms."""
-        glossary = TechnicalGlossary()
-        
         contested = glossary.get_contested()
         
         assert len(contested) > 0
@@ -192,6 +186,52 @@ class TestTechnicalGlossary:
         new_count = glossary.get_summary()["total_entries"]
         assert new_count == initial_count + 1
     
+    def test_entries_are_immutable(self, glossary):
+        """Test glossary entries cannot be changed after lookup."""
+        entry = glossary.get_entry("state")
+        
+        with pytest.raises(ValidationError):
+            entry.status = TermStatus.CONTESTED
+        assert isinstance(entry.alternatives_ar, tuple)
+    
+    def test_cached_lookups_follow_revised_entries(self):
+        """Test memoized lookups are refreshed when an entry is replaced."""
+        glossary = TechnicalGlossary()
+        state = glossary.get_entry("state")
+        assert state in glossary.search("state", status=TermStatus.APPROVED)
+        assert state in glossary.get_by_domain("political_science")
+        assert glossary.get_entry("سلطة", "ar") is state
+        
+        revised = state.model_copy(update={
+            "status": TermStatus.CONTESTED,
+            "domain": "sociology",
+            "alternatives_ar": ("كيان",),
+        })
+        glossary.add_entry(revised)
+        
+        assert glossary.search("state", status=TermStatus.APPROVED) == []
+        assert revised in glossary.search("state", status=TermStatus.CONTESTED)
+        assert revised not in glossary.get_by_domain("political_science")
+        assert glossary.get_by_domain("sociology") == [revised]
+        assert glossary.get_entry("سلطة", "ar") is None
+        assert glossary.get_entry("كيان", "ar") is revised
+    
+    @pytest.mark.parametrize(
+        "query",
+        ["state", "STATE", "st", "", "research", "search", "ism", "xyz",
+         "دولة", "البحث", "سلطة", "مجتمع أهلي", "حو", "Civil Society"],
+    )
+    def test_search_matches_full_scan(self, glossary, query):
+        """Test trigram-filtered search returns what a full scan would."""
+        expected = [
+            entry for entry in glossary._entries.values()
+            if entry.matches(query)
+            or query.lower() in entry.term_en.lower()
+            or query in entry.term_ar
+        ]
+        
+        assert glossary.search(query) == expected
+    
     def test_export_import(self):
         """Test exporting and importing glossary."""
         glossary = TechnicalGlossary()
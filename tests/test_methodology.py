@@ -18,16 +18,14 @@ from aquila_r.methodology import (
 class TestMethodologyFramework:
     """Tests for methodology framework."""
     
-    def test_framework_initialization(self):
+    def test_framework_initialization(self, framework):
         """Test framework loads paradigms."""
-        framework = MethodologyFramework()
         paradigms = framework.get_all_paradigms()
         
         assert len(paradigms) > 0
     
-    def test_get_paradigm(self):
+    def test_get_paradigm(self, framework):
         """Test getting a specific paradigm."""
-        framework = MethodologyFramework()
         desc = framework.get_paradigm(ResearchParadigm.POSITIVIST)
         
         assert desc is not None
@@ -35,9 +33,8 @@ class TestMethodologyFramework:
         assert len(desc.key_assumptions) > 0
         assert len(desc.common_methods) > 0
     
-    def test_compare_paradigms(self):
+    def test_compare_paradigms(self, framework):
         """Test comparing paradigms."""
-        framework = MethodologyFramework()
         comparison = framework.compare_paradigms(
             ResearchParadigm.POSITIVIST,
             ResearchParadigm.INTERPRETIVIST,
@@ -46,6 +43,29 @@ class TestMethodologyFramework:
         assert "paradigm_a" in comparison
         assert "paradigm_b" in comparison
         assert "complementary_aspects" in comparison
+    
+    def test_compare_paradigms_returns_copies(self):
+        """Test editing a comparison does not affect later comparisons."""
+        framework = MethodologyFramework()
+        first = framework.compare_paradigms(
+            ResearchParadigm.POSITIVIST,
+            ResearchParadigm.INTERPRETIVIST,
+        )
+        first["paradigm_a"]["name"] = "changed"
+        first["paradigm_a"]["strengths"].append("changed")
+        first["tensions"].append("changed")
+        
+        second = framework.compare_paradigms(
+            ResearchParadigm.POSITIVIST,
+            ResearchParadigm.INTERPRETIVIST,
+        )
+        
+        assert second["paradigm_a"]["name"] != "changed"
+        assert "changed" not in second["paradigm_a"]["strengths"]
+        assert "changed" not in second["tensions"]
+        assert "changed" not in framework.get_paradigm(
+            ResearchParadigm.POSITIVIST
+        ).strengths
 
 
 class TestAssumptionTracker:
@@ -129,6 +149,63 @@ class TestClaimValidator:
         assert "suggests" in hedged or "indicates" in hedged
         assert "proves" not in hedged
 
+    def test_validate_claims_counts(self):
+        """Test batch validation counters."""
+        validator = ClaimValidator()
+        result = validator.validate_claims([
+            "The data suggests a potential correlation.",
+            "This always works.",
+            "X causes Y to happen.",
+        ])
+
+        assert result.total_claims == 3
+        assert result.valid_claims + result.problematic_claims == 3
+        assert result.problematic_claims == 3
+        assert len(result.claim_validations) == 3
+
+    def test_compact_json(self):
+        """Test compact JSON omits defaults and empty fields."""
+        validator = ClaimValidator()
+        validation = validator.validate_claim(
+            "The data suggests a potential correlation.",
+            evidence="Study A",
+        )
+        payload = validation.to_json()
+
+        assert '"claim"' in payload
+        assert "suggested_qualifications" not in payload
+        assert "issues" not in payload
+    
+    def test_overridden_terms(self):
+        """Test subclass and instance term overrides are honoured."""
+        class StrictValidator(ClaimValidator):
+            OVERSTATEMENT_TERMS = ["plainly"]
+        
+        text = "The record plainly shows decline."
+        base = ClaimValidator().check_epistemic_standard(text)
+        strict = StrictValidator()
+        
+        assert base["overstatement_instances"] == 0
+        assert strict.check_epistemic_standard(text)["overstatement_instances"] == 1
+        assert strict.validate_claim(text, evidence="Archive").status == (
+            ValidationStatus.OVERSTATED
+        )
+        
+        strict.HEDGING_TERMS = ["the record"]
+        
+        assert strict.check_epistemic_standard(text)["hedging_instances"] == 1
+        assert ClaimValidator().check_epistemic_standard(text)["hedging_instances"] == 0
+        
+        strict.OVERSTATEMENT_TERMS_AR = ["قطعاً"]
+        
+        assert strict.check_epistemic_standard("ثبت قطعاً", language="ar")[
+            "overstatement_instances"
+        ] == 1
+        # Unlisted languages use the English terms
+        assert strict.check_epistemic_standard(text, language="fr")[
+            "overstatement_instances"
+        ] == 1
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,314 @@
+"""
+Test suite for Aquila-R research modules.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from aquila_r.modules import CriticalModule, ModuleResult
+from aquila_r.modules.base import ConfidenceLevel, Finding
+from aquila_r.modules.critical import MethodologicalAssessment
+from aquila_r.modules.evidence import EvidenceModule
+from aquila_r.modules.literature import (
+    LiteratureModule,
+    LiteratureResult,
+    SourceEvaluation,
+    SourceQuality,
+    SourceType,
+)
+from aquila_r.modules.synthesis import LiteratureTheme, SynthesisModule
+
+
+class TestCriticalModule:
+    """Tests for critical evaluation."""
+    
+    def test_identify_weak_claims(self):
+        """Test weak and unsupported claims are separated."""
+        critical = CriticalModule()
+        
+        weak, unsupported = critical.identify_weak_claims(
+            ["A proves B", "C is D", "E"],
+            ["study 1", "study 2", None],
+        )
+        
+        assert weak == ["A proves B"]
+        assert unsupported == ["E"]
+    
+    def test_argument_terms_in_list_order(self):
+        """Test flagged terms are reported in term-list order."""
+        critical = CriticalModule()
+        
+        evaluation = critical.evaluate_argument(
+            "Obviously every case proves that none differ", evidence="Study"
+        )
+        
+        assert [issue.split("'")[1] for issue in evaluation.logical_issues] == [
+            "proves", "obviously",
+        ]
+        assert [a.split("'")[1] for a in evaluation.assumptions] == ["every", "none"]
+    
+    def test_methodological_assessment_bounds(self):
+        """Test quality scores outside 0-1 are rejected."""
+        with pytest.raises(ValueError):
+            MethodologicalAssessment(quality_score=1.5)
+        
+        assessment = CriticalModule().assess_methodology(
+            "We used a survey of 500 respondents; one limitation is noted."
+        )
+        assert 0.0 <= assessment.quality_score <= 1.0
+    
+    @pytest.mark.parametrize(
+        "evidence",
+        [["ev"], [], ["a", "b", "c", "d"]],
+        ids=["short", "empty", "long"],
+    )
+    def test_identify_weak_claims_misaligned_evidence(self, evidence):
+        """Test evidence that does not align with claims is rejected."""
+        critical = CriticalModule()
+        
+        with pytest.raises(ValueError):
+            critical.identify_weak_claims(["A proves B", "C is D", "E"], evidence)
+
+
+class TestEvidenceModule:
+    """Tests for evidence handling."""
+    
+    def test_format_uncertainty_batch_matches_single(self):
+        """Test batch formatting equals per-value formatting."""
+        evidence = EvidenceModule()
+        values = np.array([0.0, 1.005, -0.0, 2.675, 1e20, np.nan, np.inf, -3.14159])
+        uncertainties = np.array([0.1, 0.005, 0.0, 1e-9, 1.5, 1.0, -np.inf, 0.125])
+        
+        for units in ("kg", ""):
+            batch = evidence.format_uncertainty_batch(values, uncertainties, units)
+            
+            assert batch.tolist() == [
+                evidence.format_uncertainty(value, uncertainty, units)
+                for value, uncertainty in zip(values, uncertainties, strict=True)
+            ]
+
+
+class TestSynthesisModule:
+    """Tests for synthesis."""
+    
+    @pytest.mark.parametrize("preserve", [True, False])
+    def test_synthesize_findings_batch_matches_single(self, preserve):
+        """Test column synthesis equals per-finding synthesis."""
+        synthesis = SynthesisModule()
+        confidences = [0.9, 0.8, 0.79, 0.5, 0.49, 0.125, 0.005, 0.0, 0.995, 1.0]
+        findings = [Finding(f"finding {i}", c) for i, c in enumerate(confidences)]
+        
+        batch = synthesis.synthesize_findings_batch(
+            [f.content for f in findings], np.array(confidences), preserve
+        )
+        
+        assert batch == synthesis.synthesize_findings(findings, preserve)
+    
+    def test_outline_cache_keeps_recently_used(self):
+        """Test a cache hit protects an outline from the next eviction."""
+        synthesis = SynthesisModule()
+        synthesis._OUTLINE_CACHE_SIZE = 2
+        generated = []
+        generate = synthesis._generate_english_outline
+        
+        def counting(themes, debates):
+            generated.append(themes[0].name)
+            return generate(themes, debates)
+        
+        synthesis._generate_english_outline = counting
+        
+        def outline(name):
+            theme = LiteratureTheme(name=name, description=name)
+            return synthesis.generate_literature_review_structure([theme], [])
+        
+        first = outline("a")
+        outline("b")
+        assert outline("a") == first
+        outline("c")
+        outline("a")
+        outline("b")
+        
+        assert generated == ["a", "b", "c", "b"]
+    
+    def test_keyword_themes_match_substring_search(self):
+        """Test keyword themes count findings as per-keyword substring checks."""
+        synthesis = SynthesisModule()
+        keywords = ["data", "Database", "base", "ab", "bc", "AI", "ai", "الهوية"]
+        findings = [
+            Finding("A DATABASE of records", 0.9),
+            Finding("abc and Ai", 0.6, language="fr"),
+            Finding("database design", 0.5, language="ar"),
+            Finding("أسئلة الهوية الوطنية", 0.7, language="ar"),
+            Finding("nothing here", 0.4),
+        ]
+        
+        themes = synthesis.identify_themes(findings, min_occurrence=1, keywords=keywords)
+        
+        expected = {}
+        for keyword in keywords:
+            matching = [f for f in findings if keyword.casefold() in f.content.casefold()]
+            if matching:
+                expected[keyword] = (len(matching), sorted({f.language for f in matching}))
+        assert {t.name: (t.source_count, t.languages) for t in themes} == expected
+        assert [t.name for t in themes] == list(expected)
+    
+    @pytest.mark.parametrize(
+        "confidences",
+        [[0.5, float("nan")], [1.5, 0.5], [0.5]],
+        ids=["nan", "out-of-range", "misaligned"],
+    )
+    def test_synthesize_findings_batch_rejects_invalid(self, confidences):
+        """Test confidences a Finding would reject are rejected."""
+        with pytest.raises(ValueError):
+            SynthesisModule().synthesize_findings_batch(
+                ["a", "b"], np.array(confidences)
+            )
+
+
+class TestConfidenceLevel:
+    """Tests for confidence level mapping."""
+    
+    @pytest.mark.parametrize(
+        "score, level",
+        [
+            (float("nan"), ConfidenceLevel.VERY_LOW),
+            (-0.5, ConfidenceLevel.VERY_LOW),
+            (0.3, ConfidenceLevel.LOW),
+            (0.69, ConfidenceLevel.MEDIUM),
+            (0.7, ConfidenceLevel.HIGH),
+            (0.9, ConfidenceLevel.VERY_HIGH),
+            (1.5, ConfidenceLevel.VERY_HIGH),
+        ],
+    )
+    def test_from_score(self, score, level):
+        """Test scores map to levels, with NaN treated as very low."""
+        assert ConfidenceLevel.from_score(score) == level
+
+
+class TestModuleResult:
+    """Tests for module results."""
+    
+    def test_confidence_histogram(self):
+        """Test findings are counted per confidence level."""
+        result = ModuleResult(
+            module_name="test",
+            findings=[Finding("a", 0.2), Finding("b", 0.95), Finding("c", 0.96)],
+        )
+        
+        histogram = result.confidence_histogram()
+        
+        assert histogram["very_low"] == 1
+        assert histogram["very_high"] == 2
+        assert sum(histogram.values()) == 3
+    
+    def test_confidence_histogram_after_replacement(self):
+        """Test replacing a finding in place updates the histogram."""
+        result = ModuleResult(module_name="test", findings=[Finding("a", 0.2)])
+        assert result.confidence_histogram()["very_low"] == 1
+        
+        result.findings[0] = Finding("b", 0.95)
+        histogram = result.confidence_histogram()
+        
+        assert histogram["very_low"] == 0
+        assert histogram["very_high"] == 1
+    
+    def test_executed_at_round_trip(self):
+        """Test a given executed_at is kept and serialized as before."""
+        executed_at = datetime(2020, 1, 1, 12, 30, 15, 123456)
+        result = ModuleResult(module_name="test", executed_at=executed_at)
+        
+        assert result.executed_at == executed_at
+        assert result.model_dump()["executed_at"] == executed_at
+        assert "executed_at_ns" not in result.model_dump()
+        assert ModuleResult.model_validate_json(
+            result.model_dump_json()
+        ).executed_at == executed_at
+        
+        aware = datetime(2020, 1, 1, 14, 30, tzinfo=timezone(timedelta(hours=2)))
+        assert ModuleResult(module_name="test", executed_at=aware).executed_at == (
+            datetime(2020, 1, 1, 12, 30)
+        )
+
+
+class TestLiteratureResult:
+    """Tests for literature results."""
+    
+    def test_source_filters_after_replacement(self):
+        """Test filters reflect a source replaced in place."""
+        old = SourceEvaluation(
+            source_id="a",
+            title="Old",
+            quality=SourceQuality.HIGH,
+            source_type=SourceType.BOOK,
+        )
+        new = SourceEvaluation(
+            source_id="b",
+            title="New",
+            quality=SourceQuality.LOW,
+            language="ar",
+        )
+        result = LiteratureResult(module_name="literature", sources=[old])
+        assert result.get_high_quality_sources() == [old]
+        
+        result.sources[0] = new
+        
+        assert result.get_high_quality_sources() == []
+        assert result.get_sources_by_language("ar") == [new]
+        assert result.get_sources_by_type(SourceType.BOOK) == []
+    
+    def test_bulk_matches_single_evaluation(self):
+        """Test each bulk item equals the per-source evaluation."""
+        literature = LiteratureModule()
+        columns = {
+            "titles": ["Survey of X", "Thesis on Y", "Report", "Peer-reviewed study"],
+            "authors": [("Ali", "Bo"), ["Chen"], [], ("Dana",)],
+            "years": [2020, None, 1999, 2021],
+            "abstracts": [None, "A dissertation on Y", "Short", None],
+            "source_types": [None, None, SourceType.REPORT, SourceType.PEER_REVIEWED],
+            "languages": ["en", "ar", "en", "en"],
+            "urls": [None, "https://example.org", None, None],
+            "dois": ["10.1/x", None, None, "10.1/y"],
+        }
+        
+        bulk = literature.evaluate_sources_bulk(**columns)
+        singles = [
+            literature.evaluate_source(
+                title, authors, year, abstract, source_type, language, url, doi
+            )
+            for title, authors, year, abstract, source_type, language, url, doi
+            in zip(*columns.values(), strict=True)
+        ]
+        
+        assert len(bulk) == len(singles)
+        assert [bulk[i] for i in range(len(bulk))] == singles
+        assert bulk.get_high_quality_sources() == [
+            s for s in singles if s.quality == SourceQuality.HIGH
+        ]
+    
+    def test_source_id_ignores_authors_container(self):
+        """Test tuple and list authors give the same source id."""
+        literature = LiteratureModule()
+        
+        as_list = literature.evaluate_source("T", ["A", "B"], 2020)
+        literature = LiteratureModule()
+        as_tuple = literature.evaluate_source("T", ("A", "B"), 2020)
+        bulk = literature.evaluate_sources_bulk(["T"], [("A", "B")], [2020])
+        
+        assert as_list.source_id == as_tuple.source_id == bulk[0].source_id
+        assert bulk[0].authors == ["A", "B"]
+    
+    def test_bulk_rejects_misaligned_columns(self):
+        """Test columns shorter or longer than titles are rejected."""
+        literature = LiteratureModule()
+        
+        with pytest.raises(ValueError):
+            literature.evaluate_sources_bulk(["A", "B"], [["x"], ["y"]], years=[2020])
+        with pytest.raises(ValueError):
+            literature.evaluate_sources_bulk(
+                ["A"], [["x"]], source_types=[None, SourceType.BOOK]
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
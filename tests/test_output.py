@@ -4,19 +4,30 @@ Test suite for Aquila-R output components.
 
 import pytest
 from aquila_r.output import (
-    OutputStandards,
     OutputSection,
+    STANDARDS,
     format_research_output,
     MarkdownFormatter,
 )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_output_caches():
+    """Render once per format and language so tests time warm caches."""
+    for format_type, language in [("markdown", "en"), ("markdown", "ar"), ("html", "en")]:
+        format_research_output(
+            {OutputSection.CONTEXT: "x"},
+            format_type=format_type,
+            language=language,
+        )
+
+
 class TestOutputStandards:
     """Tests for output standards."""
     
     def test_section_titles(self):
         """Test section title retrieval."""
-        standards = OutputStandards()
+        standards = STANDARDS
         
         en_title = standards.get_section_title(OutputSection.METHODOLOGY, "en")
         ar_title = standards.get_section_title(OutputSection.METHODOLOGY, "ar")
@@ -26,7 +37,7 @@ class TestOutputStandards:
     
     def test_required_sections(self):
         """Test retrieving required sections."""
-        standards = OutputStandards()
+        standards = STANDARDS
         required = standards.get_required_sections()
         
         assert OutputSection.CONTEXT in required
@@ -35,7 +46,7 @@ class TestOutputStandards:
     
     def test_output_validation(self):
         """Test output validation logic."""
-        standards = OutputStandards()
+        standards = STANDARDS
         
         # Valid output
         valid_sections = {
@@ -63,55 +74,53 @@ class TestOutputStandards:
 class TestFormatters:
     """Tests for output formatters."""
     
-    def test_markdown_formatter(self):
-        """Test markdown formatting."""
-        sections = {
-            OutputSection.CONTEXT: "This is the context.",
-            OutputSection.ANALYSIS: "This is the analysis.",
-        }
-        
-        output = format_research_output(
-            sections,
-            format_type="markdown",
-            language="en",
-        )
-        
-        assert "# Research Analysis" in output
-        assert "## Context" in output
-        assert "This is the context." in output
-    
-    def test_arabic_markdown(self):
-        """Test Arabic markdown formatting."""
-        sections = {
-            OutputSection.CONTEXT: "هذا هو السياق.",
-        }
-        
-        output = format_research_output(
-            sections,
-            format_type="markdown",
-            language="ar",
-        )
-        
-        assert "# تحليل بحثي" in output
-        assert "السياق" in output
-        assert "هذا هو السياق." in output
-    
-    def test_html_formatter(self):
-        """Test HTML formatting."""
-        sections = {
-            OutputSection.CONTEXT: "Context content.",
-        }
-        
+    @pytest.mark.parametrize(
+        "format_type, language, sections, expected",
+        [
+            pytest.param(
+                "markdown",
+                "en",
+                {
+                    OutputSection.CONTEXT: "This is the context.",
+                    OutputSection.ANALYSIS: "This is the analysis.",
+                },
+                ["# Research Analysis", "## Context", "This is the context."],
+                id="markdown",
+            ),
+            pytest.param(
+                "markdown",
+                "ar",
+                {OutputSection.CONTEXT: "هذا هو السياق."},
+                ["# تحليل بحثي", "السياق", "هذا هو السياق."],
+                id="arabic-markdown",
+            ),
+            pytest.param(
+                "html",
+                "en",
+                {OutputSection.CONTEXT: "Context content."},
+                ["<html", "<h1>Research Analysis</h1>", "<p>Context content.</p>"],
+                id="html",
+            ),
+            pytest.param(
+                "html",
+                "en",
+                {OutputSection.CONTEXT: "a < b & c > d"},
+                ["<p>a &lt; b &amp; c &gt; d</p>"],
+                id="html-escaping",
+            ),
+        ],
+    )
+    def test_format_research_output(self, format_type, language, sections, expected):
+        """Test each output format renders its title and section content."""
         output = format_research_output(
             sections,
-            format_type="html",
-            language="en",
+            format_type=format_type,
+            language=language,
         )
         
-        assert "<html" in output
-        assert "<h1>Research Analysis</h1>" in output
-        assert "<p>Context content.</p>" in output
+        for needle in expected:
+            assert needle in output
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    pytest.main([__file__, "-v", "-p", "no:cacheprovider", "--no-header"])
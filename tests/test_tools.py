@@ -0,0 +1,151 @@
+"""
+Test suite for Aquila-R tool integration.
+"""
+
+import asyncio
+
+import pytest
+from aquila_r.tools import RetrievalTool, SearchResult, search_many
+from aquila_r.tools.base import ToolStatus
+from aquila_r.tools.parsing import DocumentParser, ParsedDocument, ParsedSection
+
+
+class FakeRetrievalTool(RetrievalTool):
+    """Retrieval tool returning canned results, or raising."""
+    
+    name = "fake"
+    
+    def __init__(self, titles=(), error=None, config=None):
+        super().__init__(config)
+        self.titles = list(titles)
+        self.error = error
+        self.calls = 0
+    
+    async def search(self, query, max_results=10, language=None):
+        """Return the canned titles, or raise the configured error."""
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return [SearchResult(title=title) for title in self.titles[:max_results]]
+
+
+class BrokenExecuteTool(FakeRetrievalTool):
+    """Retrieval tool whose execute raises instead of returning a failure."""
+    
+    async def execute(self, **kwargs):
+        """Raise unconditionally."""
+        raise RuntimeError("execute crashed")
+
+
+class FakeParser(DocumentParser):
+    """Parser finishing in reverse order of its inputs."""
+    
+    name = "fake_parser"
+    
+    async def parse(self, source):
+        """Parse after a delay that shrinks with the source length."""
+        if source == "missing":
+            raise FileNotFoundError(source)
+        await asyncio.sleep(0.01 / (len(source) + 1))
+        return ParsedDocument(
+            title=source.upper(),
+            sections=[ParsedSection(content=source * 2)],
+            source_path=source,
+        )
+
+
+class TestSearchMany:
+    """Tests for concurrent multi-tool search."""
+    
+    async def test_results_in_tool_order(self):
+        """Test each tool yields one result, in tool order."""
+        tools = [FakeRetrievalTool(["A", "B"]), FakeRetrievalTool(["C"])]
+        
+        results = await search_many(tools, "state formation")
+        
+        assert [r.status for r in results] == [ToolStatus.SUCCESS] * 2
+        assert [[s.title for s in r.data] for r in results] == [["A", "B"], ["C"]]
+    
+    async def test_failing_tool_keeps_other_results(self):
+        """Test one failing tool does not discard the others."""
+        tools = [
+            FakeRetrievalTool(["A"]),
+            FakeRetrievalTool(error=ConnectionError("offline")),
+            BrokenExecuteTool(["B"]),
+        ]
+        
+        results = await search_many(tools, "state formation")
+        
+        assert results[0].is_success()
+        assert [s.title for s in results[0].data] == ["A"]
+        assert results[1].status == ToolStatus.FAILED
+        assert "offline" in results[1].error
+        assert results[2].status == ToolStatus.FAILED
+        assert "execute crashed" in results[2].error
+    
+    async def test_uses_tool_cache(self):
+        """Test repeated searches are served from each tool's cache."""
+        tool = FakeRetrievalTool(["A"])
+        
+        await search_many([tool], "state formation")
+        await search_many([tool], "state formation")
+        
+        assert tool.calls == 1
+
+
+
+class TestRetrievalCache:
+    """Tests for the retrieval result cache."""
+    
+    async def test_cache_hit_is_independent_copy(self):
+        """Test mutating a returned result does not change later hits."""
+        tool = FakeRetrievalTool(["A"])
+        
+        first = await tool.execute(query="state formation")
+        first.data.append(SearchResult(title="injected"))
+        first.data[0].title = "changed"
+        first.metadata["note"] = "mutated"
+        
+        second = await tool.execute(query="state formation")
+        second.data.clear()
+        third = await tool.execute(query="state formation")
+        
+        assert tool.calls == 1
+        assert [s.title for s in third.data] == ["A"]
+        assert "note" not in third.metadata
+        assert third.timestamp >= first.timestamp
+    
+    async def test_cache_disabled(self):
+        """Test a cache_size of 0 searches every time."""
+        tool = FakeRetrievalTool(["A"], config={"cache_size": 0})
+        
+        await tool.execute(query="state formation")
+        await tool.execute(query="state formation")
+        
+        assert tool.calls == 2
+
+
+class TestParseMany:
+    """Tests for concurrent document parsing."""
+    
+    async def test_matches_sequential_parse(self):
+        """Test concurrent parsing returns what parse gives, in input order."""
+        parser = FakeParser()
+        sources = ["a", "bbbb", "cc", "a", ""]
+        
+        documents = await parser.parse_many(sources)
+        
+        assert documents == [await parser.parse(source) for source in sources]
+    
+    async def test_empty(self):
+        """Test no sources yield no documents."""
+        assert await FakeParser().parse_many([]) == []
+    
+    async def test_error_propagates(self):
+        """Test a failing source raises as a direct parse would."""
+        with pytest.raises(FileNotFoundError):
+            await FakeParser().parse_many(["a", "missing", "b"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])